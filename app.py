@@ -33,7 +33,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('C:\\Users\\Nitro\\aicvgen\\simplified\\app.log', mode='a'),
+        logging.FileHandler(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.log'), mode='a'),
         logging.StreamHandler()
     ]
 )
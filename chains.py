@@ -7,8 +7,16 @@ chains create new information by calling the LLM.
 # pylint: disable=logging-fstring-interpolation
 # pylint: disable=line-too-long
 
+import functools
+import hashlib
+import json
 import logging
-from typing import List, Any, Dict
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import List, Any, Dict, Optional
 
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -98,6 +106,109 @@ llm = ChatGoogleGenerativeAI(
 
 # Prompt templates are now imported from prompts.py
 
+# In-process LLM response cache shared by all chains built below. The LLM
+# calls dominate workflow latency by orders of magnitude, and re-running the
+# same JD/CV (or revisiting an entry without new feedback) produces the same
+# structured output, so identical inputs skip the provider round-trip.
+# LRU-bounded so long sessions with many distinct CVs cannot grow it forever.
+_RESPONSE_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_RESPONSE_CACHE_MAXSIZE = 256
+
+# Disk-backed second level for the response cache. The in-memory LRU dies
+# with the Streamlit process; persisting responses lets a re-run of the same
+# CV against the same JD after a restart skip the provider round-trips.
+# Entries expire after a TTL so stale responses cannot live forever.
+_DISK_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".llm_cache.sqlite3")
+_DISK_CACHE_TTL_SECONDS = 24 * 60 * 60
+_disk_cache_conn: Optional[sqlite3.Connection] = None
+
+
+def _get_disk_cache() -> sqlite3.Connection:
+    """Open the cache database lazily, creating the table on first use."""
+    global _disk_cache_conn
+    if _disk_cache_conn is None:
+        conn = sqlite3.connect(_DISK_CACHE_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response BLOB, created_at INTEGER)"
+        )
+        conn.commit()
+        _disk_cache_conn = conn
+    return _disk_cache_conn
+
+
+def _disk_cache_get(key: str) -> Any:
+    """Return the cached result for key, or None on miss, expiry, or error.
+
+    Disk problems must never break a chain invocation, so every failure mode
+    degrades to a cache miss.
+    """
+    try:
+        conn = _get_disk_cache()
+        row = conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if time.time() - row[1] >= _DISK_CACHE_TTL_SECONDS:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        return pickle.loads(row[0])
+    except (sqlite3.Error, pickle.UnpicklingError, OSError) as e:
+        logger.warning(f"Disk response cache read failed: {e}")
+        return None
+
+
+def _disk_cache_put(key: str, result: Any) -> None:
+    """Persist a chain result; failures are logged and otherwise ignored."""
+    try:
+        conn = _get_disk_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(result), int(time.time()))
+        )
+        conn.commit()
+    except (sqlite3.Error, pickle.PicklingError, OSError) as e:
+        logger.warning(f"Disk response cache write failed: {e}")
+
+
+def _response_cache_key(chain_name: str, inputs: Dict[str, Any]) -> str:
+    """Build a content-addressed key for a chain invocation.
+
+    Inputs are canonicalized as sorted-key JSON so dict ordering does not
+    fragment the cache; non-JSON values fall back to str().
+    """
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256((chain_name + "\x00" + payload).encode("utf-8")).hexdigest()
+
+
+def _with_response_cache(chain, chain_name: str):
+    """Wrap a chain so repeated invocations with identical inputs reuse the
+    previously computed result instead of calling the LLM again.
+
+    Cached results are the parsed chain outputs (Pydantic models), which the
+    nodes treat as immutable, so sharing one object across hits is safe.
+    """
+    def cached_invoke(inputs: Dict[str, Any]) -> Any:
+        key = _response_cache_key(chain_name, inputs)
+        if key in _RESPONSE_CACHE:
+            logger.info(f"{chain_name} response cache hit")
+            _RESPONSE_CACHE.move_to_end(key)
+            return _RESPONSE_CACHE[key]
+        result = _disk_cache_get(key)
+        if result is not None:
+            logger.info(f"{chain_name} disk response cache hit")
+        else:
+            result = chain.invoke(inputs)
+            _disk_cache_put(key, result)
+        _RESPONSE_CACHE[key] = result
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+        return result
+
+    return RunnableLambda(cached_invoke)
+
 def _create_structured_output_chain(prompt_template: str, output_schema: BaseModel, chain_name: str, input_preprocessor=None):
     """Generic factory function to create structured output chains.
 
@@ -125,7 +236,7 @@ def _create_structured_output_chain(prompt_template: str, output_schema: BaseMod
     else:
         chain = RunnablePassthrough.assign(**{}) | RunnableLambda(log_chain_execution) | prompt | llm.with_structured_output(output_schema) | RunnableLambda(log_chain_result)
 
-    return chain
+    return _with_response_cache(chain, chain_name)
 
 def _create_json_parsing_chain(prompt_template: str, chain_name: str, result_processor):
     """Generic factory function for JSON parsing chains.
@@ -145,8 +256,9 @@ def _create_json_parsing_chain(prompt_template: str, chain_name: str, result_pro
 
     json_parser = JsonOutputParser()
     chain = RunnablePassthrough.assign(**{}) | RunnableLambda(log_chain_execution) | prompt | llm | json_parser | RunnableLambda(result_processor)
-    return chain
+    return _with_response_cache(chain, chain_name)
 
+@functools.cache
 def create_job_description_parsing_chain():
     """Create a chain to parse job descriptions into structured data."""
     return _create_structured_output_chain(
@@ -155,6 +267,7 @@ def create_job_description_parsing_chain():
         chain_name="Job Description Parsing"
     )
 
+@functools.cache
 def create_cv_parsing_chain():
     """Create a chain to parse raw CV text into structured format."""
     def parse_and_validate_cv(json_result: dict) -> StructuredCV:
@@ -178,6 +291,7 @@ def create_cv_parsing_chain():
         result_processor=parse_and_validate_cv
     )
 
+@functools.cache
 def create_key_qualifications_chain():
     """Create a chain to generate key qualifications."""
     def prepare_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -203,22 +317,48 @@ def create_key_qualifications_chain():
         input_preprocessor=prepare_inputs
     )
 
+def _prepare_entry_tailoring_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Prepare entry-tailoring inputs by adding human feedback section if provided.
+
+    Feedback must be part of the chain inputs (not just the prompt) so a
+    revision keys differently in the response cache than the original call.
+    """
+    prepared = inputs.copy()
+
+    if "human_feedback" in inputs and inputs["human_feedback"]:
+        prepared["human_feedback_section"] = f"""
+        [Human Feedback - IMPORTANT]
+        The user has provided specific feedback on the previous version of this entry. Please incorporate this feedback:
+        {inputs['human_feedback']}
+
+        Adjust the tailored entry based on this feedback while maintaining relevance to the job description and key qualifications."""
+    else:
+        prepared["human_feedback_section"] = ""
+
+    return prepared
+
+
+@functools.cache
 def create_experience_tailoring_chain():
     """Create a chain to tailor work experience entries."""
     return _create_structured_output_chain(
         prompt_template=EXPERIENCE_TAILORING_PROMPT,
         output_schema=TailoredEntryOutput,
-        chain_name="Experience Tailoring"
+        chain_name="Experience Tailoring",
+        input_preprocessor=_prepare_entry_tailoring_inputs
     )
 
+@functools.cache
 def create_projects_tailoring_chain():
     """Create a chain to tailor projects section."""
     return _create_structured_output_chain(
         prompt_template=PROJECTS_TAILORING_PROMPT,
         output_schema=TailoredEntryOutput,
-        chain_name="Projects Tailoring"
+        chain_name="Projects Tailoring",
+        input_preprocessor=_prepare_entry_tailoring_inputs
     )
 
+@functools.cache
 def create_executive_summary_chain():
     """Create a chain to generate executive summaries."""
     def prepare_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -244,6 +384,7 @@ def create_executive_summary_chain():
         input_preprocessor=prepare_inputs
     )
 
+@functools.cache
 def create_section_mapping_chain():
     """Create a chain to map CV sections to standardized concepts."""
     return _create_structured_output_chain(
@@ -252,6 +393,7 @@ def create_section_mapping_chain():
         chain_name="Section Mapping"
     )
 
+@functools.cache
 def create_latex_fixer_chain():
     """Creates a more advanced chain that attempts to fix broken LaTeX code."""
     prompt = ChatPromptTemplate.from_template(LATEX_FIXER_PROMPT)
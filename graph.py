@@ -109,6 +109,32 @@ def create_cv_generation_graph() -> StateGraph:
 
     return workflow.compile()
 
+# Step-to-node dispatch table for the router: one dict lookup instead of a
+# ~20-branch if-chain on a function that fires on every graph edge
+_ROUTES: Dict[str, str] = {
+    "input": PARSE_JD_NODE,
+    "job_description_parsed": PARSE_CV_NODE,
+    "cv_parsed": SETUP_ITERATIVE_SESSION_NODE,
+    "iterative_session_ready": MAP_SOURCE_SECTIONS_NODE,
+    "source_sections_mapped": GENERATE_QUALIFICATIONS_NODE,
+    "sections_mapped": GENERATE_QUALIFICATIONS_NODE,
+    "qualifications_approved": TAILOR_EXPERIENCE_NODE,
+    "start_experience_tailoring": TAILOR_EXPERIENCE_NODE,
+    "experience_entry_tailored": SHOULD_CONTINUE_EXPERIENCE_NODE,
+    "continue_experience_tailoring": TAILOR_EXPERIENCE_NODE,
+    "experience_tailoring_complete": TAILOR_PROJECT_ENTRY_NODE,
+    "start_projects_tailoring": TAILOR_PROJECT_ENTRY_NODE,
+    "project_entry_tailored": SHOULD_CONTINUE_PROJECTS_NODE,
+    "continue_projects_tailoring": TAILOR_PROJECT_ENTRY_NODE,
+    "projects_tailoring_complete": GENERATE_SUMMARY_NODE,
+    "start_summary_generation": GENERATE_SUMMARY_NODE,
+    "summary_approved": FINALIZE_CV_NODE,
+    "start_cv_finalization": FINALIZE_CV_NODE,
+    "cv_finalized": END,
+    "cv_parsing_failed": END,
+}
+
+
 def workflow_router(state: AppState) -> str:
     """Central router that determines the next node based on current_step.
 
@@ -126,47 +152,33 @@ def workflow_router(state: AppState) -> str:
         return END
 
     # Route based on current step - LIVING DOCUMENT PATTERN
-    if current_step == "input":
-        return PARSE_JD_NODE
-    elif current_step == "job_description_parsed":
-        return PARSE_CV_NODE
-    elif current_step == "cv_parsed":
-        return SETUP_ITERATIVE_SESSION_NODE
-    elif current_step == "iterative_session_ready":
-        return MAP_SOURCE_SECTIONS_NODE
-    elif current_step == "source_sections_mapped" or current_step == "sections_mapped":
-        return GENERATE_QUALIFICATIONS_NODE
-    elif current_step == "qualifications_approved" or current_step == "start_experience_tailoring":
-        return TAILOR_EXPERIENCE_NODE
-    elif current_step == "experience_entry_tailored":
-        return SHOULD_CONTINUE_EXPERIENCE_NODE
-    elif current_step == "continue_experience_tailoring":
-        return TAILOR_EXPERIENCE_NODE
-    elif current_step == "experience_tailoring_complete" or current_step == "start_projects_tailoring":
-        return TAILOR_PROJECT_ENTRY_NODE
-    elif current_step == "project_entry_tailored":
-        return SHOULD_CONTINUE_PROJECTS_NODE
-    elif current_step == "continue_projects_tailoring":
-        return TAILOR_PROJECT_ENTRY_NODE
-    elif current_step == "projects_tailoring_complete" or current_step == "start_summary_generation":
-        return GENERATE_SUMMARY_NODE
-    elif current_step == "summary_approved" or current_step == "start_cv_finalization":
-        return FINALIZE_CV_NODE
-    elif current_step == "cv_finalized":
-        return END
-    elif current_step == "cv_parsing_failed":
-        return END
-    else:
+    next_node = _ROUTES.get(current_step)
+    if next_node is None:
         logger.warning(f"Unknown current_step: {current_step}")
         return END
+    return next_node
 
 # Old conditional functions removed - using router pattern now
 
+# Compiled graph singleton: the topology is static, so building and compiling
+# the StateGraph once per process is enough. run_graph_step used to rebuild it
+# on every workflow step.
+_COMPILED_GRAPH = None
+
+
+def _get_graph():
+    """Return the compiled workflow graph, building it on first use."""
+    global _COMPILED_GRAPH
+    if _COMPILED_GRAPH is None:
+        _COMPILED_GRAPH = create_cv_generation_graph()
+    return _COMPILED_GRAPH
+
+
 def run_graph_step(state: AppState) -> AppState:
     """Execute one step of the graph workflow.
 
     This function is called by app.py to advance the workflow.
-    It creates a fresh graph instance and invokes it with the current state.
+    It invokes the shared compiled graph with the current state.
 
     Args:
         state: Current application state
@@ -174,9 +186,17 @@ def run_graph_step(state: AppState) -> AppState:
     Returns:
         AppState: Updated state after graph execution
     """
+    # Fast-path states the router immediately maps to END: building and
+    # invoking the graph would only copy state through a no-op superstep.
+    # This is hit every time the UI reruns while a human review is pending.
+    current_step = state.get("current_step", "input")
+    if current_step in ("cv_finalized", "cv_parsing_failed") or "awaiting" in current_step:
+        logger.info(f"Skipping graph execution for terminal/paused step: {current_step}")
+        return state
+
     try:
         logger.info(f"Starting graph execution with state: {state.get('current_step', 'unknown')}")
-        graph = create_cv_generation_graph()
+        graph = _get_graph()
         result = graph.invoke(state)
 
         # Ensure we return a valid AppState
@@ -184,19 +204,16 @@ def run_graph_step(state: AppState) -> AppState:
             logger.info(f"Graph execution completed successfully. New step: {result.get('current_step', 'unknown')}")
             return result
         else:
-            # Fallback if graph returns unexpected format
+            # Fallback if graph returns unexpected format. Annotate the caller's
+            # state in place instead of shallow-copying the whole AppState.
             logger.error("Graph returned unexpected format")
-            return {
-                **state,
-                "error_message": "Graph returned unexpected format",
-                "has_error": True
-            }
+            state["error_message"] = "Graph returned unexpected format"
+            state["has_error"] = True
+            return state
 
     except Exception as e:
         # Handle any graph execution errors
         logger.error(f"Graph execution failed: {str(e)}")
-        return {
-            **state,
-            "error_message": f"Graph execution failed: {str(e)}",
-            "has_error": True
-        }
\ No newline at end of file
+        state["error_message"] = f"Graph execution failed: {str(e)}"
+        state["has_error"] = True
+        return state
\ No newline at end of file
@@ -1,32 +1,120 @@
 # latex_compiler.py
 
+import asyncio
 import logging
+import mmap
+import re
+import shutil
 import subprocess
 import tempfile
 import os
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
-def compile_latex_to_pdf(latex_string: str) -> Dict[str, Any]:
+# Pool shared by acompile_latex_to_pdf. Created lazily so importing this
+# module never spawns workers. Threads are sufficient: the actual work runs
+# in the pdflatex child process and subprocess.run releases the GIL.
+_compile_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_compile_pool() -> ThreadPoolExecutor:
+    global _compile_pool
+    if _compile_pool is None:
+        _compile_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _compile_pool
+
+# Commands that need a second pdflatex pass to converge via the .aux file.
+# The CVs built by latex_generator contain none of these, so the common case
+# compiles in a single pass.
+_NEEDS_SECOND_PASS_RE = re.compile(
+    r"\\(?:ref|pageref|cite|tableofcontents|listoffigures|listoftables|label)\b"
+)
+
+# How much of the end of cv.log to read on failure. Pathological TeX failures
+# can produce logs of tens of MB; the actual error is reported near the end.
+_LOG_TAIL_BYTES = 8192
+
+_BEGIN_END_RE = re.compile(r"\\(begin|end)\{([^}]*)\}")
+_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+
+
+def _structural_error(latex_string: str) -> Optional[str]:
+    """Cheap Python-side prescreen for errors that make a compile pointless.
+
+    LLM-fixed documents sometimes come back truncated or with mismatched
+    environments; pdflatex takes seconds to fail on those. This scanner only
+    flags constructs that are always fatal (missing document skeleton,
+    unbalanced \\begin/\\end), so a flagged document could never have
+    compiled anyway. Deliberately does not count braces: escaped braces in
+    user content make that check unreliable.
+
+    Args:
+        latex_string: The complete LaTeX document as a string.
+
+    Returns:
+        An error message formatted like a pdflatex log line, or None if the
+        document passes the prescreen.
+    """
+    if "\\documentclass" not in latex_string:
+        return "! Structural check failed: missing \\documentclass."
+    if "\\begin{document}" not in latex_string:
+        return "! Structural check failed: missing \\begin{document}."
+
+    stack = []
+    for line_no, line in enumerate(latex_string.splitlines(), start=1):
+        for match in _BEGIN_END_RE.finditer(_COMMENT_RE.sub("", line)):
+            kind, env = match.groups()
+            if kind == "begin":
+                stack.append((env, line_no))
+            elif not stack:
+                return (f"! Structural check failed: \\end{{{env}}} on line "
+                        f"{line_no} has no matching \\begin.")
+            else:
+                open_env, open_line = stack.pop()
+                if open_env != env:
+                    return (f"! Structural check failed: \\begin{{{open_env}}} on line "
+                            f"{open_line} is closed by \\end{{{env}}} on line {line_no}.")
+    if stack:
+        open_env, open_line = stack[-1]
+        return (f"! Structural check failed: \\begin{{{open_env}}} on line "
+                f"{open_line} is never closed.")
+    return None
+
+def compile_latex_to_pdf(latex_string: str, full_log_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Compiles a LaTeX string to a PDF using pdflatex.
 
     Args:
         latex_string: The complete LaTeX document as a string.
+        full_log_path: Optional destination path. On failure, the complete
+            cv.log is stream-copied here byte-for-byte without being loaded
+            into memory.
 
     Returns:
         A dictionary with "success": True and "pdf_bytes": bytes if successful,
-        or "success": False and "log": str with the error log on failure.
+        or "success": False and "log": str with the tail of the error log on failure.
     """
     logger.info("Attempting to compile LaTeX string to PDF.")
+
+    # Fail fast on documents that can never compile, instead of paying for a
+    # pdflatex run just to learn the same thing from its log. The synthetic
+    # message mimics a log error line so the fixer chain can act on it.
+    structural_error = _structural_error(latex_string)
+    if structural_error is not None:
+        logger.warning("Structural prescreen rejected document: %s", structural_error)
+        return {"success": False, "log": structural_error}
+
     with tempfile.TemporaryDirectory() as temp_dir:
         tex_file_path = os.path.join(temp_dir, "cv.tex")
         with open(tex_file_path, "w", encoding='utf-8') as f:
             f.write(latex_string)
 
-        # Run pdflatex twice to resolve references
-        for i in range(2):
+        # A second pass is only needed when the document has cross-references
+        # to resolve; skipping it halves pdflatex wall-clock in the common case.
+        passes = 2 if _NEEDS_SECOND_PASS_RE.search(latex_string) else 1
+        for i in range(passes):
             try:
                 process = subprocess.run(
                     ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, tex_file_path],
@@ -45,8 +133,13 @@ def compile_latex_to_pdf(latex_string: str) -> Dict[str, Any]:
 
         pdf_file_path = os.path.join(temp_dir, "cv.pdf")
         if os.path.exists(pdf_file_path):
+            # Map the PDF and snapshot it in a single copy. This bypasses the
+            # buffered reader's intermediate chunks for multi-MB PDFs. A bytes
+            # snapshot is still required because the result flows through
+            # LangGraph state and session JSON, and it must outlive temp_dir.
             with open(pdf_file_path, "rb") as f:
-                pdf_bytes = f.read()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pdf_bytes = bytes(mm)
             logger.info("PDF generated successfully.")
             return {"success": True, "pdf_bytes": pdf_bytes}
         else:
@@ -54,9 +147,37 @@ def compile_latex_to_pdf(latex_string: str) -> Dict[str, Any]:
             # Read the log file for debugging
             log_path = os.path.join(temp_dir, "cv.log")
             if os.path.exists(log_path):
-                with open(log_path, 'r', encoding='utf-8', errors='replace') as log_file:
-                    log_content = log_file.read()
-                logger.error(f"LaTeX log content: {log_content[-1000:]}")
-                return {"success": False, "log": log_content}
+                if full_log_path:
+                    # Stream the full log to the caller's file without ever
+                    # materializing it as a Python string.
+                    shutil.copyfile(log_path, full_log_path)
+                # Read only the tail; errors are reported at the end of the log.
+                log_size = os.path.getsize(log_path)
+                with open(log_path, 'rb') as log_file:
+                    log_file.seek(max(0, log_size - _LOG_TAIL_BYTES))
+                    log_tail = log_file.read().decode('utf-8', errors='replace')
+                logger.error(f"LaTeX log content: {log_tail[-1000:]}")
+                return {"success": False, "log": log_tail}
             else:
-                return {"success": False, "log": "Compilation failed and no log file found."}
\ No newline at end of file
+                return {"success": False, "log": "Compilation failed and no log file found."}
+
+async def acompile_latex_to_pdf(latex_string: str, full_log_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async adapter around compile_latex_to_pdf.
+
+    Runs the compile on a shared pool so callers can overlap several pdflatex
+    runs (e.g. asyncio.gather over multiple CV variants) instead of shelling
+    out serially. pdflatex itself is single-threaded, so the speedup comes
+    from keeping multiple compiler processes in flight across cores.
+
+    Args:
+        latex_string: The complete LaTeX document as a string.
+        full_log_path: Passed through to compile_latex_to_pdf.
+
+    Returns:
+        The same result dictionary as compile_latex_to_pdf.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_compile_pool(), compile_latex_to_pdf, latex_string, full_log_path
+    )
@@ -1,12 +1,25 @@
 # latex_generator.py
 
 import logging
+from typing import Dict, Optional
 from models import StructuredCV, CVEntry, Section
 
 logger = logging.getLogger(__name__)
 
 # --- Helper Functions ---
 
+def _find_section(sections_by_name: Dict[str, Section], keyword: str) -> Optional[Section]:
+    """Looks up a section by lowercase name, falling back to a substring match.
+
+    The exact-key lookup covers the canonical names produced by the workflow
+    ("experience", "projects", ...); the substring fallback keeps compatibility
+    with variants like "Key Qualifications" or "Executive Summary".
+    """
+    section = sections_by_name.get(keyword)
+    if section is not None:
+        return section
+    return next((s for key, s in sections_by_name.items() if keyword in key), None)
+
 def _escape_latex(text: str) -> str:
     """Escapes special LaTeX characters in a string."""
     if not text:
@@ -81,45 +94,46 @@ def _generate_header(info: dict, summary_text: str) -> str:
     header.append("\\end{minipage}\\vspace*{\\fill}\\end{minipage}\\vspace{2mm}\\end{minipage}}%\\vspace{5mm}")
     return "\n".join(header)
 
-def _generate_main_column(sections: list[Section]) -> str:
+def _generate_main_column(sections_by_name: Dict[str, Section]) -> str:
     """Generates the LaTeX for the main (left) column."""
     content = []
-    for section in sections:
-        if section.name.lower() in ["experience", "projects"]:
-            content.append(f"\\sectionheader{{{_escape_latex(section.name)}}}")
-
-            if section.name.lower() == "experience":
-                for entry in section.entries:
-                    # The JSON subtitle "Company | Location" is split for processing
-                    company, location = (entry.subtitle.split('|', 1) + [None])[:2] if entry.subtitle else (None, None)
-                    company = company.strip() if company else ''
-                    location = location.strip() if location else ''
-
-                    # Metadata line is constructed as "Location • Date"
-                    date_str = _escape_latex(entry.date_range or '')
-                    loc_str = _escape_latex(location)
-                    metadata = f"{loc_str} \\textperiodcentered\\ {date_str}" if loc_str and date_str else (loc_str or date_str)
-
-                    arg1 = _escape_latex(company)
-                    arg2 = _escape_latex(entry.title or '') # Job title is now argument #2
-                    arg3 = ""
-                    arg4 = metadata.strip()
-                    arg5 = "".join([f"\\item {_escape_latex(d)}\n" for d in entry.details])
-                    content.append(f"\\cvitemrole{{{arg1}}}{{{arg2}}}{{{arg3}}}{{{arg4}}}{{{arg5}}}")
-
-            elif section.name.lower() == "projects":
-                for entry in section.entries:
-                    tech = f"Technologies: {_escape_latex(', '.join(entry.tags))}" if entry.tags else ""
-                    arg1 = _escape_latex(entry.title or '') # Project title is argument #1
-                    arg2 = ""
-                    arg3 = ""
-                    arg4 = tech # Technologies string is now argument #4
-                    arg5 = "".join([f"\\item {_escape_latex(d)}\n" for d in entry.details])
-                    content.append(f"\\cvitemrole{{{arg1}}}{{{arg2}}}{{{arg3}}}{{{arg4}}}{{{arg5}}}")
+
+    experience_section = sections_by_name.get("experience")
+    if experience_section:
+        content.append(f"\\sectionheader{{{_escape_latex(experience_section.name)}}}")
+        for entry in experience_section.entries:
+            # The JSON subtitle "Company | Location" is split for processing
+            company, location = (entry.subtitle.split('|', 1) + [None])[:2] if entry.subtitle else (None, None)
+            company = company.strip() if company else ''
+            location = location.strip() if location else ''
+
+            # Metadata line is constructed as "Location • Date"
+            date_str = _escape_latex(entry.date_range or '')
+            loc_str = _escape_latex(location)
+            metadata = f"{loc_str} \\textperiodcentered\\ {date_str}" if loc_str and date_str else (loc_str or date_str)
+
+            arg1 = _escape_latex(company)
+            arg2 = _escape_latex(entry.title or '') # Job title is now argument #2
+            arg3 = ""
+            arg4 = metadata.strip()
+            arg5 = "".join([f"\\item {_escape_latex(d)}\n" for d in entry.details])
+            content.append(f"\\cvitemrole{{{arg1}}}{{{arg2}}}{{{arg3}}}{{{arg4}}}{{{arg5}}}")
+
+    projects_section = sections_by_name.get("projects")
+    if projects_section:
+        content.append(f"\\sectionheader{{{_escape_latex(projects_section.name)}}}")
+        for entry in projects_section.entries:
+            tech = f"Technologies: {_escape_latex(', '.join(entry.tags))}" if entry.tags else ""
+            arg1 = _escape_latex(entry.title or '') # Project title is argument #1
+            arg2 = ""
+            arg3 = ""
+            arg4 = tech # Technologies string is now argument #4
+            arg5 = "".join([f"\\item {_escape_latex(d)}\n" for d in entry.details])
+            content.append(f"\\cvitemrole{{{arg1}}}{{{arg2}}}{{{arg3}}}{{{arg4}}}{{{arg5}}}")
 
     return "\n".join(content)
 
-def _generate_sidebar(sections: list[Section], info: dict) -> str:
+def _generate_sidebar(sections_by_name: Dict[str, Section], info: dict) -> str:
     """Generates the LaTeX for the sidebar (right) column."""
     content = []
 
@@ -133,46 +147,54 @@ def _generate_sidebar(sections: list[Section], info: dict) -> str:
     content.append(r"{\small\color{bodycolor}\bfseries P:~}{\small\color{bodycolor}" + phone_escaped + r"}\par")
 
     # --- Skills Section (from Key Qualifications) ---
-    quals_section = next((s for s in sections if 'qualifications' in s.name.lower()), None)
+    quals_section = _find_section(sections_by_name, "qualifications")
     if quals_section:
         content.append("\\sectionheader{Skills}")
-        content.append("\\begin{itemize}[nosep, itemsep=0.4ex]\\small\\mdseries\\color{bodycolor}")
-        for entry in quals_section.entries:
-            content.append(f"\\item {_escape_latex(entry.title)}")
-        content.append("\\end{itemize}")
+        # Single join over a generator instead of one list-append per \item
+        content.append(
+            "\\begin{itemize}[nosep, itemsep=0.4ex]\\small\\mdseries\\color{bodycolor}\n"
+            + "\n".join(f"\\item {_escape_latex(e.title)}" for e in quals_section.entries)
+            + "\n\\end{itemize}"
+        )
 
     # --- Education, Certifications, and Languages ---
-    for section in sections:
-        if section.name.lower() == "education":
-            content.append(f"\\sectionheader{{{_escape_latex(section.name)}}}")
-            for entry in section.entries:
-                detail_text = entry.details[0] if entry.details else ''
-                content.append(f"\\cvsidebaritem{{{_escape_latex(entry.title or '')}}}{{{_escape_latex(entry.subtitle or '')}}}{{{_escape_latex(detail_text)}}}")
-
-        elif section.name.lower() == "certifications":
-            content.append(f"\\sectionheader{{{_escape_latex(section.name)}}}")
-            if section.entries and section.entries[0].details:
-                for cert_string in section.entries[0].details:
-                    # Safely parse "Certification Name (Provider, Year)"
-                    parts = cert_string.split('(', 1)
-                    title = parts[0].strip()
-                    # Check if subtitle exists before accessing it
-                    subtitle = ''
-                    if len(parts) > 1:
-                        subtitle = parts[1].replace(')', '').strip()
-
-                    content.append(f"\\cvsidebaritem{{{_escape_latex(title)}}}{{{_escape_latex(subtitle)}}}{{}}")
-
-        elif section.name.lower() == "languages":
-            content.append(f"\\sectionheader{{{_escape_latex(section.name)}}}")
-            # The actual language items are in the 'details' array of the first entry
-            if section.entries and section.entries[0].details:
-                content.append("\\begin{itemize}[nosep, itemsep=0.4ex]\\small\\mdseries\\color{bodycolor}")
-                for lang_string in section.entries[0].details:
-                    # Reformat "Language (Proficiency)" to "Language: Proficiency"
-                    formatted_lang = lang_string.replace(" (", ": ").replace(")", "")
-                    content.append(f"\\item {_escape_latex(formatted_lang)}")
-                content.append("\\end{itemize}")
+    education_section = sections_by_name.get("education")
+    if education_section:
+        content.append(f"\\sectionheader{{{_escape_latex(education_section.name)}}}")
+        content.append("\n".join(
+            f"\\cvsidebaritem{{{_escape_latex(entry.title or '')}}}{{{_escape_latex(entry.subtitle or '')}}}{{{_escape_latex(entry.details[0] if entry.details else '')}}}"
+            for entry in education_section.entries
+        ))
+
+    certifications_section = sections_by_name.get("certifications")
+    if certifications_section:
+        content.append(f"\\sectionheader{{{_escape_latex(certifications_section.name)}}}")
+        if certifications_section.entries and certifications_section.entries[0].details:
+            for cert_string in certifications_section.entries[0].details:
+                # Safely parse "Certification Name (Provider, Year)"
+                parts = cert_string.split('(', 1)
+                title = parts[0].strip()
+                # Check if subtitle exists before accessing it
+                subtitle = ''
+                if len(parts) > 1:
+                    subtitle = parts[1].replace(')', '').strip()
+
+                content.append(f"\\cvsidebaritem{{{_escape_latex(title)}}}{{{_escape_latex(subtitle)}}}{{}}")
+
+    languages_section = sections_by_name.get("languages")
+    if languages_section:
+        content.append(f"\\sectionheader{{{_escape_latex(languages_section.name)}}}")
+        # The actual language items are in the 'details' array of the first entry.
+        # "Language (Proficiency)" is reformatted to "Language: Proficiency".
+        if languages_section.entries and languages_section.entries[0].details:
+            content.append(
+                "\\begin{itemize}[nosep, itemsep=0.4ex]\\small\\mdseries\\color{bodycolor}\n"
+                + "\n".join(
+                    f"\\item {_escape_latex(lang.replace(' (', ': ').replace(')', ''))}"
+                    for lang in languages_section.entries[0].details
+                )
+                + "\n\\end{itemize}"
+            )
 
     return "\n".join(content)
 
@@ -187,6 +209,10 @@ def generate_latex_string(cv_data: StructuredCV) -> str:
 
     doc_parts = []
 
+    # Index the sections once; all subroutines use direct key lookups instead
+    # of re-scanning the list with per-section .lower() comparisons.
+    sections_by_name = {s.name.lower(): s for s in cv_data.sections}
+
     # 1. Preamble
     doc_parts.append(_generate_preamble())
 
@@ -194,7 +220,7 @@ def generate_latex_string(cv_data: StructuredCV) -> str:
     doc_parts.append("\\begin{document}")
 
     # 3. Header
-    summary_section = next((s for s in cv_data.sections if 'summary' in s.name.lower()), None)
+    summary_section = _find_section(sections_by_name, "summary")
     summary_text = ". ".join(summary_section.entries[0].details) if (summary_section and summary_section.entries) else ""
     doc_parts.append(_generate_header(cv_data.personal_info, summary_text))
 
@@ -202,9 +228,9 @@ def generate_latex_string(cv_data: StructuredCV) -> str:
     # Set the ratio of columns: 67% for left column, 33% for right column
     doc_parts.append("\\columnratio{0.67}")
     doc_parts.append("\\begin{paracol}{2}")
-    doc_parts.append(_generate_main_column(cv_data.sections))
+    doc_parts.append(_generate_main_column(sections_by_name))
     doc_parts.append("\\switchcolumn")
-    doc_parts.append(_generate_sidebar(cv_data.sections, cv_data.personal_info))
+    doc_parts.append(_generate_sidebar(sections_by_name, cv_data.personal_info))
     doc_parts.append("\\end{paracol}")
 
     # 5. Document End
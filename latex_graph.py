@@ -6,7 +6,10 @@ This module implements a LangGraph-based workflow for generating PDF documents f
 The graph handles LaTeX generation, compilation, error detection, and automatic fixing with retry logic.
 """
 
+import functools
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict
 from langgraph.graph import StateGraph, END
 from models import StructuredCV
@@ -16,6 +19,84 @@ from chains import create_latex_fixer_chain
 
 logger = logging.getLogger(__name__)
 
+# Executor used to run a speculative fixer-chain call in the background while
+# pdflatex compiles the current candidate. One worker is enough: the retry
+# loop only ever has a single compile in flight.
+_SPECULATION_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Pending speculative fix as a (candidate_code, error_signature, future) tuple,
+# or None when no speculation is in flight. Module-level is safe because the
+# compiled graph below is a module singleton invoked sequentially.
+_speculative_fix = None
+
+# Error signatures that have already survived one fix attempt. Speculation is
+# only worthwhile for these: the common case is a single fix followed by a
+# clean compile, and speculating there would double the fixer's LLM cost for
+# a result that gets thrown away.
+_SEEN_SIGNATURES = set()
+
+
+def _discard_speculation() -> None:
+    """Drop any pending speculative fix, cancelling it if still queued.
+
+    A future that has already started cannot be interrupted, but dropping the
+    reference guarantees a stale result is never reused against a newer
+    failure and does not linger in module state after the graph ends.
+    """
+    global _speculative_fix
+    if _speculative_fix is not None:
+        _speculative_fix[2].cancel()
+        _speculative_fix = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fixer_chain():
+    """Build the fixer chain once and reuse it across retries and CVs.
+
+    The chain (prompt template + model client + output parser) is identical
+    for every invocation, so rebuilding it per retry was pure overhead.
+    """
+    return create_latex_fixer_chain()
+
+
+# Completed fixer results keyed by (faulty_code, error_log) digest. The
+# generator is deterministic for a given StructuredCV, so the same code can
+# fail with the same log across runs; a hit skips a full LLM round-trip.
+_FIX_CACHE = {}
+
+
+def _fix_cache_key(faulty_code: str, error_log: str) -> str:
+    """Build a compact cache key for a (faulty_code, error_log) pair.
+
+    Args:
+        faulty_code: The LaTeX source that failed to compile
+        error_log: The pdflatex log produced by that failure
+
+    Returns:
+        str: Hex digest identifying this exact failure
+    """
+    payload = (faulty_code + "\x00" + error_log).encode("utf-8", errors="replace")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _error_signature(error_log: str) -> str:
+    """Reduce a pdflatex error log to the first reported error line.
+
+    Retries tend to fail with the same error class (e.g. the same undefined
+    control sequence), so the first "!" line is a good identity for deciding
+    whether a speculative fix computed against an older log is still valid.
+
+    Args:
+        error_log: Full pdflatex log text
+
+    Returns:
+        str: The first error line, or a truncated prefix when none is found
+    """
+    for line in error_log.splitlines():
+        if line.startswith("!"):
+            return line.strip()
+    return error_log[:200]
+
 class LatexAgentState(TypedDict):
     """
     State dictionary for the LaTeX generation workflow.
@@ -89,16 +170,42 @@ def reflect_and_fix_node(state: LatexAgentState):
         dict: Updated state with either corrected latex_string and incremented retries,
               or error termination when fixer fails to make changes
     """
+    global _speculative_fix
+
     logger.info("Reflecting on error and attempting to fix...")
-    fixer_chain = create_latex_fixer_chain()
+    fixer_chain = _get_fixer_chain()
 
     faulty_code = state['latex_string']
     error_log = state['error_log']
+    signature = _error_signature(error_log)
+    repeat_failure = signature in _SEEN_SIGNATURES
+    _SEEN_SIGNATURES.add(signature)
+
+    # A previous run may already have fixed this exact (code, log) failure.
+    cache_key = _fix_cache_key(faulty_code, error_log)
+    corrected_latex = _FIX_CACHE.get(cache_key)
+    if corrected_latex is not None:
+        logger.info("Fix cache hit. Skipping fixer chain invocation.")
 
-    corrected_latex = fixer_chain.invoke({
-        "faulty_code": faulty_code,
-        "error_log": error_log
-    })
+    # Check whether a speculative fix launched during the previous retry
+    # matches the failure we just observed. If so, the LLM round-trip already
+    # overlapped with the pdflatex run and we can reuse its result.
+    if corrected_latex is None and _speculative_fix is not None:
+        spec_code, spec_signature, spec_future = _speculative_fix
+        _speculative_fix = None
+        if spec_code == faulty_code and spec_signature == signature:
+            logger.info("Speculative fix matches the observed failure. Reusing it.")
+            corrected_latex = spec_future.result()
+        else:
+            spec_future.cancel()
+
+    if corrected_latex is None:
+        corrected_latex = fixer_chain.invoke({
+            "faulty_code": faulty_code,
+            "error_log": error_log
+        })
+
+    _FIX_CACHE[cache_key] = corrected_latex
 
     # If the fixer chain returns the same broken code, terminate the loop.
     if corrected_latex.strip() == faulty_code.strip():
@@ -109,6 +216,20 @@ def reflect_and_fix_node(state: LatexAgentState):
         }
     else:
         logger.info("Fixer chain provided a new version of the code. Retrying compilation.")
+
+        # Speculatively fix the corrected code against the same error signature
+        # while the next compile runs. If that compile fails the same way, the
+        # next pass through this node reuses the result instead of waiting for
+        # a fresh LLM round-trip; otherwise the speculation is discarded.
+        # Only worthwhile once this signature has already survived a fix
+        # attempt — first-time failures usually compile cleanly after one fix.
+        if repeat_failure and state.get('retries', 0) + 1 < MAX_RETRIES:
+            spec_future = _SPECULATION_POOL.submit(fixer_chain.invoke, {
+                "faulty_code": corrected_latex,
+                "error_log": error_log
+            })
+            _speculative_fix = (corrected_latex, signature, spec_future)
+
         return {
             "latex_string": corrected_latex,
             "retries": state.get('retries', 0) + 1
@@ -131,9 +252,12 @@ def should_retry(state: LatexAgentState):
     """
     if state['error_log'] is None:
         logger.info("Compilation successful. Ending graph.")
+        # Any speculation launched for the previous failure is now moot.
+        _discard_speculation()
         return "end"
     elif state.get('retries', 0) >= MAX_RETRIES:
         logger.error("Max retries reached. Ending graph with failure.")
+        _discard_speculation()
         return "end_with_error"
     else:
         logger.info("Compilation failed. Retrying with fix...")
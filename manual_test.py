@@ -49,9 +49,9 @@ def run_manual_test():
         logging.error(f"The latex_generator.py script itself crashed: {e}")
         return
 
-    # 4. Run the LaTeX compiler
+    # 4. Run the LaTeX compiler (streams the full log to COMPILER_LOG_FILE on failure)
     logging.info("Compiling LaTeX string...")
-    result = compile_latex_to_pdf(latex_string)
+    result = compile_latex_to_pdf(latex_string, full_log_path=COMPILER_LOG_FILE)
 
     # 5. Report the final result
     if result["success"]:
@@ -64,13 +64,9 @@ def run_manual_test():
         logging.error("❌ ❌ ❌ FAILURE: PDF compilation failed.")
         error_log = result.get("log", "No log content available.")
 
-        # Log the error to a dedicated file
-        try:
-            with open(COMPILER_LOG_FILE, "w", encoding="utf-8") as f:
-                f.write(error_log)
+        # The compiler already stream-copied the full log to the dedicated file
+        if os.path.exists(COMPILER_LOG_FILE):
             logging.error(f"Detailed compiler error log has been saved to: {COMPILER_LOG_FILE}")
-        except Exception as e:
-            logging.error(f"Failed to write to {COMPILER_LOG_FILE}: {e}")
 
         # Also print a snippet to the console for quick view
         print("\n--- Compiler Error Snippet ---")
@@ -6,8 +6,9 @@ in the project besides AppState TypedDict.
 """
 
 from enum import Enum
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import List, Literal, Optional, Dict
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 
@@ -30,6 +31,14 @@ class WorkPolicy(str, Enum):
     FLEXIBLE = "flexible"
 
 
+# Literal aliases used for the model fields below: validating against a
+# Literal stays on pydantic's plain-string fast path and serializes for free,
+# while the Enum classes remain available as symbolic constants (their str
+# values still pass Literal validation).
+ExperienceLevelStr = Literal["entry", "junior", "mid", "senior", "lead", "principal", "executive"]
+WorkPolicyStr = Literal["remote", "hybrid", "onsite", "flexible"]
+
+
 class SkillRequirement(BaseModel):
     """A skill requirement extracted from a job description."""
     name: str = Field(description="The specific skill or technology")
@@ -44,11 +53,21 @@ class JobDescriptionData(BaseModel):
     key_responsibilities: List[str] = Field(description="Main responsibilities listed")
     technical_skills: List[SkillRequirement] = Field(description="Technical skills with requirement level")
     soft_skills: List[str] = Field(default_factory=list, description="Soft skills mentioned")
-    experience_level: ExperienceLevel = Field(description="Required experience level")
-    work_policy: Optional[WorkPolicy] = Field(default=None, description="Work arrangement if specified")
+    experience_level: ExperienceLevelStr = Field(description="Required experience level")
+    work_policy: Optional[WorkPolicyStr] = Field(default=None, description="Work arrangement if specified")
     industry: Optional[str] = Field(default=None, description="Industry or domain if specified")
     salary_range: Optional[str] = Field(default=None, description="Salary information if mentioned")
 
+    @cached_property
+    def required_skill_names(self) -> List[str]:
+        """Names of skills marked as required, computed once per instance."""
+        return [skill.name for skill in self.technical_skills if skill.is_required]
+
+    @cached_property
+    def preferred_skill_names(self) -> List[str]:
+        """Names of skills marked as preferred, computed once per instance."""
+        return [skill.name for skill in self.technical_skills if not skill.is_required]
+
 
 class CVEntry(BaseModel):
     """A single entry in any CV section."""
@@ -70,6 +89,30 @@ class StructuredCV(BaseModel):
     personal_info: Dict[str, str] = Field(description="Name, contact information, etc.")
     sections: List[Section] = Field(description="All CV sections (experience, education, etc.)")
 
+    # Lazily built casefolded-name -> Section index. Nodes create a fresh
+    # StructuredCV whenever sections change, so caching per instance is safe.
+    _section_index: Optional[Dict[str, Section]] = PrivateAttr(default=None)
+
+    def get_section(self, keyword: str) -> Optional[Section]:
+        """Return the section matching keyword (casefolded), or None.
+
+        Exact names hit an O(1) dict lookup; a substring fallback keeps the
+        looser matching used throughout the app, e.g. get_section
+        ("qualifications") finding a section named "Key Qualifications".
+
+        Args:
+            keyword: Lowercase section name or name fragment
+
+        Returns:
+            Optional[Section]: The matching section, or None if absent
+        """
+        if self._section_index is None:
+            self._section_index = {s.name.casefold(): s for s in self.sections}
+        section = self._section_index.get(keyword)
+        if section is not None:
+            return section
+        return next((s for key, s in self._section_index.items() if keyword in key), None)
+
 
 # Note: Output models removed - using living document pattern
 # All generated content is directly added to StructuredCV sections
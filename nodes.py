@@ -4,10 +4,11 @@ This module contains stateless node functions that orchestrate the workflow.
 Following the constitutional rules, nodes take AppState as input and return
 a Python dictionary as output. They must not have side effects.
 """
-# pylint: disable=logging-fstring-interpolation
 # pylint: disable=line-too-long
 
+import json
 import logging
+from itertools import chain as iter_chain
 from typing import Dict, Any
 from chains import (
     create_job_description_parsing_chain,
@@ -18,13 +19,77 @@ from chains import (
     create_projects_tailoring_chain,
     create_section_mapping_chain,
 )
-from models import StructuredCV, Section
+from models import StructuredCV, Section, CVEntry, SectionMap
 from state import AppState
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _with_sections(cv: StructuredCV, new_sections: list) -> StructuredCV:
+    """Build a StructuredCV that shares the given Section objects unchanged.
+
+    Nodes only ever prepend, drop, or replace whole sections; the sections
+    themselves are treated as immutable. model_construct skips Pydantic
+    validation, turning what used to be a validating deep copy of the whole
+    CV into an O(num_sections) pointer copy.
+    """
+    return StructuredCV.model_construct(
+        personal_info=cv.personal_info, sections=new_sections
+    )
+
+
+def _drop_section(cv: StructuredCV, keyword: str) -> StructuredCV:
+    """Return a CV without the section matching keyword, sharing the rest.
+
+    Used by the regeneration paths to discard a previously generated section;
+    the lookup goes through the cached section index and the match is removed
+    by identity. Returns cv unchanged when no section matches.
+    """
+    target = cv.get_section(keyword)
+    if target is None:
+        return cv
+    return _with_sections(cv, [s for s in cv.sections if s is not target])
+
+
+def _upsert_entry(
+    cv: StructuredCV, section_name: str, entry: CVEntry, index: int
+) -> StructuredCV:
+    """Return a CV with entry placed at index in the named section.
+
+    Replaces the entry when the index already exists (revision) or appends it
+    (first-time generation); a missing section is created at the end. One
+    pass over the sections, sharing every untouched object with the input CV.
+    """
+    found = False
+    new_sections = []
+    for section in cv.sections:
+        if section.name != section_name:
+            new_sections.append(section)
+            continue
+        found = True
+        if index < len(section.entries):
+            # This is a revision - splice the replacement in directly
+            new_entries = [
+                *section.entries[:index],
+                entry,
+                *section.entries[index + 1:],
+            ]
+            logger.info("Replacing existing entry at index %d during revision", index)
+        else:
+            # This is first-time generation - append the new entry
+            new_entries = [*section.entries, entry]
+            logger.info("Appending new entry at index %d", index)
+        new_sections.append(
+            Section.model_construct(name=section_name, entries=new_entries)
+        )
+    if not found:
+        new_sections.append(
+            Section.model_construct(name=section_name, entries=[entry])
+        )
+    return _with_sections(cv, new_sections)
+
+
 def parse_job_description_node(state: AppState) -> Dict[str, Any]:
     """Parse the raw job description into structured data."""
     logger.info("Starting job description parsing node")
@@ -40,14 +105,14 @@ def parse_job_description_node(state: AppState) -> Dict[str, Any]:
         result = chain.invoke({"job_description": state["raw_job_description"]})
 
         logger.info(
-            f"Job description parsing successful. Job title: {result.job_title}"
+            "Job description parsing successful. Job title: %s", result.job_title
         )
         return {
             "job_description_data": result,
             "current_step": "job_description_parsed",
         }
     except Exception as e:
-        logger.error(f"Job description parsing failed: {str(e)}")
+        logger.error("Job description parsing failed: %s", e)
         return {"error_message": f"Failed to parse job description: {str(e)}"}
 
 
@@ -65,12 +130,12 @@ def parse_cv_node(state: AppState) -> Dict[str, Any]:
         chain = create_cv_parsing_chain()
         result = chain.invoke({"cv_text": state["raw_cv_text"]})
 
-        logger.info(
-            f"CV parsing successful. Candidate: {result.personal_info['name'] if result.personal_info and 'name' in result.personal_info else 'Unknown'}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            candidate = result.personal_info.get("name", "Unknown") if result.personal_info else "Unknown"
+            logger.info("CV parsing successful. Candidate: %s", candidate)
         return {"tailored_cv": result, "current_step": "cv_parsed"}
     except Exception as e:
-        logger.error(f"CV parsing failed: {str(e)}")
+        logger.error("CV parsing failed: %s", e)
         return {
             "error_message": f"CV parsing failed: {str(e)}. Please check the CV format and try again.",
             "human_review_required": True,
@@ -88,14 +153,16 @@ def setup_iterative_session_node(state: AppState) -> Dict[str, Any]:
     logger.info("Starting iterative session setup node")
 
     try:
-        import copy
-
         if "tailored_cv" not in state:
             logger.error("tailored_cv key not found in state for session setup")
             return {"error_message": "Failed to setup iterative session: tailored_cv not found."}
 
-        # Create the read-only backup from the initial tailored_cv
-        source_cv = copy.deepcopy(state["tailored_cv"])
+        # Create the read-only backup from the initial tailored_cv. Sections
+        # and entries are never mutated in place (nodes rebuild CVs through
+        # _with_sections), so the backup can share them outright instead of
+        # deep-copying the whole tree; only the list itself is fresh.
+        tailored_cv = state["tailored_cv"]
+        source_cv = _with_sections(tailored_cv, list(tailored_cv.sections))
         experience_index = 0
 
         logger.info("Iterative session setup successful")
@@ -105,33 +172,85 @@ def setup_iterative_session_node(state: AppState) -> Dict[str, Any]:
             "current_step": "iterative_session_ready",
         }
     except Exception as e:
-        logger.error(f"Iterative session setup failed: {str(e)}")
+        logger.error("Iterative session setup failed: %s", e)
         return {"error_message": f"Failed to setup iterative session: {str(e)}"}
 
 
+# Section names that unambiguously identify the summary and qualifications
+# concepts, matched case-insensitively as substrings
+_SUMMARY_NAME_KEYWORDS = ("summary", "profile", "objective", "about")
+_QUALIFICATIONS_NAME_KEYWORDS = ("qualification", "skill", "competenc", "expertise")
+
+
+def _deterministic_section_map(source_cv: StructuredCV) -> "SectionMap | None":
+    """Map summary/qualifications sections by name, without an LLM.
+
+    Returns a SectionMap when both concepts resolve unambiguously from the
+    section names alone, or None when the CV needs the LLM-based mapper.
+    """
+    summary_idx = None
+    qualifications_idx = None
+    for idx, section in enumerate(source_cv.sections):
+        key = section.name.casefold()
+        if summary_idx is None and any(k in key for k in _SUMMARY_NAME_KEYWORDS):
+            summary_idx = idx
+        elif qualifications_idx is None and any(
+            k in key for k in _QUALIFICATIONS_NAME_KEYWORDS
+        ):
+            qualifications_idx = idx
+    if summary_idx is None or qualifications_idx is None:
+        return None
+    return SectionMap(
+        executive_summary_source_index=summary_idx,
+        qualifications_source_index=qualifications_idx,
+    )
+
+
 def map_source_sections_node(state: AppState) -> dict:
     """Analyzes the source_cv to map concepts to section indices."""
     logger.info("Starting source section mapping node")
     try:
-        import json
-
         source_cv = state.get("source_cv")
         if not source_cv:
             return {"error_message": "Source CV not found for section mapping."}
 
-        # Convert the Pydantic model to a JSON string for the prompt
-        source_cv_json = source_cv.model_dump_json(indent=2)
+        # Common case first: most parsed CVs use conventional section names,
+        # so a keyword scan resolves the map without an LLM round-trip. Only
+        # ambiguous CVs fall through to the chain.
+        section_map = _deterministic_section_map(source_cv)
+        if section_map is None:
+            # Convert the Pydantic model to a JSON string for the prompt.
+            # Compact form: indentation only inflates the LLM's input tokens.
+            source_cv_json = source_cv.model_dump_json()
+
+            chain = create_section_mapping_chain()
+            section_map = chain.invoke({"source_cv_json": source_cv_json})
+        else:
+            logger.info("Section map resolved deterministically from section names")
 
-        chain = create_section_mapping_chain()
-        section_map = chain.invoke({"source_cv_json": source_cv_json})
+        # Precompute the read-only views the per-entry tailoring nodes need,
+        # so they don't rescan source_cv sections on every invocation
+        qualifications_section = source_cv.get_section("qualifications")
+        experience_section = source_cv.get_section("experience")
+        projects_section = source_cv.get_section("projects")
 
-        logger.info(f"Section mapping successful: {section_map}")
+        logger.info("Section mapping successful: %s", section_map)
         return {
             "section_map": section_map,
+            "qualifications_titles": (
+                [entry.title for entry in qualifications_section.entries]
+                if qualifications_section else []
+            ),
+            "source_experience_entries": (
+                experience_section.entries if experience_section else []
+            ),
+            "source_project_entries": (
+                projects_section.entries if projects_section else []
+            ),
             "current_step": "source_sections_mapped"
         }
     except Exception as e:
-        logger.error(f"Source section mapping failed: {str(e)}")
+        logger.error("Source section mapping failed: %s", e)
         return {"error_message": f"Source section mapping failed: {str(e)}"}
 
 
@@ -149,7 +268,9 @@ def generate_key_qualifications_node(state: AppState) -> Dict[str, Any]:
 
         if not job_data or not cv_data:
             logger.error(
-                f"Missing required data. Job data: {job_data is not None}, CV data: {cv_data is not None}"
+                "Missing required data. Job data: %s, CV data: %s",
+                job_data is not None,
+                cv_data is not None,
             )
             return {
                 "error_message": "Missing parsed job description or CV data. Please ensure both inputs are provided and parsed successfully."
@@ -158,75 +279,88 @@ def generate_key_qualifications_node(state: AppState) -> Dict[str, Any]:
         # If this is a regeneration (human_approved=False), remove existing qualifications
         if state.get("human_approved") == False:
             logger.info("Regenerating qualifications based on user feedback")
-            cv_data = cv_data.model_copy(deep=True)
-            cv_data.sections = [s for s in cv_data.sections if "qualifications" not in s.name.lower()]
-
-        # Extract skills from CV sections (looking for skills/technologies in entries)
-        current_skills = []
-        for section in cv_data.sections:
-            for entry in section.entries:
-                current_skills.extend(entry.tags)
-
-        # Prepare job requirements from the new model structure
-        required_skills = [
-            skill.name for skill in job_data.technical_skills if skill.is_required
-        ]
-        preferred_skills = [
-            skill.name for skill in job_data.technical_skills if not skill.is_required
-        ]
+            cv_data = _drop_section(cv_data, "qualifications")
+
+        # The serialized prompt inputs are invariant across regeneration
+        # loops (only the feedback changes), so they are built once and
+        # carried in state for reuse when the user rejects a draft.
+        job_requirements_json = state.get("job_requirements_json")
+        current_skills_json = state.get("current_skills_json")
+        if job_requirements_json is None or current_skills_json is None:
+            # Extract skills from CV sections (looking for skills/technologies
+            # in entries). Tags repeat heavily across sections, so deduplicate
+            # before shipping them to the LLM; sorting keeps the prompt (and
+            # the response cache key) deterministic.
+            current_skills = sorted(
+                set(
+                    iter_chain.from_iterable(
+                        entry.tags for section in cv_data.sections for entry in section.entries
+                    )
+                )
+            )
 
-        job_requirements = {
-            "required_skills": required_skills,
-            "preferred_skills": preferred_skills,
-            "key_responsibilities": job_data.key_responsibilities,
-        }
+            # Prepare job requirements from the new model structure. The skill
+            # partitions are cached on the model, so review loops that
+            # re-enter this node don't rescan technical_skills.
+            job_requirements = {
+                "required_skills": job_data.required_skill_names,
+                "preferred_skills": job_data.preferred_skill_names,
+                "key_responsibilities": job_data.key_responsibilities,
+            }
+
+            # JSON is cheaper to produce than repr() and parses more reliably
+            # for the LLM (double quotes, null instead of None).
+            job_requirements_json = json.dumps(job_requirements)
+            current_skills_json = json.dumps(current_skills)
 
         chain = create_key_qualifications_chain()
 
         # Include human feedback if this is a regeneration
         chain_input = {
-            "job_requirements": str(job_requirements),
-            "current_skills": str(current_skills),
+            "job_requirements": job_requirements_json,
+            "current_skills": current_skills_json,
         }
 
         if state.get("human_approved") == False and state.get("human_feedback"):
             chain_input["human_feedback"] = state["human_feedback"]
-            logger.info(f"Including human feedback in regeneration: {state['human_feedback'][:100]}...")
+            logger.info("Including human feedback in regeneration: %.100s...", state["human_feedback"])
 
         result = chain.invoke(chain_input)
 
         # LIVING DOCUMENT PATTERN: Add qualifications directly to tailored_cv
-        from models import Section, CVEntry
-
-        # Create CVEntry objects for each qualification
+        # Create CVEntry objects for each qualification. model_construct skips
+        # validation, which is safe for fields this code just built itself.
         qualification_entries = [
-            CVEntry(
+            CVEntry.model_construct(
                 title=qualification, subtitle=None, date_range=None, details=[], tags=[]
             )
             for qualification in result.qualifications
         ]
 
         # Create new Key Qualifications section
-        qualifications_section = Section(
+        qualifications_section = Section.model_construct(
             name="Key Qualifications", entries=qualification_entries
         )
 
-        # Create updated CV with the new section at the beginning
-        updated_cv = cv_data.model_copy(deep=True)
-        updated_cv.sections.insert(0, qualifications_section)
+        # Create updated CV with the new section at the beginning, sharing the
+        # existing sections instead of deep-copying them
+        updated_cv = _with_sections(cv_data, [qualifications_section, *cv_data.sections])
 
         logger.info(
-            f"Key qualifications generation successful. Added {len(result.qualifications)} qualifications to tailored_cv"
+            "Key qualifications generation successful. Added %d qualifications to tailored_cv",
+            len(result.qualifications),
         )
 
         return {
             "tailored_cv": updated_cv,  # Update tailored_cv instead of structured_cv
+            "job_requirements_json": job_requirements_json,
+            "current_skills_json": current_skills_json,
             "current_step": "awaiting_qualifications_review",
             "human_approved": None,  # Clear the approval flag
             "human_feedback": None,  # Clear the feedback
         }
     except Exception as e:
-        logger.error(f"Key qualifications generation failed: {str(e)}")
+        logger.error("Key qualifications generation failed: %s", e)
         return {"error_message": f"Failed to generate key qualifications: {str(e)}"}
 
 
@@ -236,12 +370,11 @@ def request_human_review_node(state: AppState) -> Dict[str, Any]:
     cv_data = state.get("tailored_cv")
     qualifications_content = ""
     if cv_data:
-        for section in cv_data.sections:
-            if "qualifications" in section.name.lower():
-                qualifications_content = "\n".join(
-                    [f"• {entry.title}" for entry in section.entries]
-                )
-                break
+        qualifications_section = cv_data.get_section("qualifications")
+        if qualifications_section:
+            qualifications_content = "\n".join(
+                [f"• {entry.title}" for entry in qualifications_section.entries]
+            )
     if qualifications_content:
         review_content = qualifications_content
     else:
@@ -263,35 +396,51 @@ def tailor_experience_node(state: AppState) -> Dict[str, Any]:
     logger.info("Starting iterative experience tailoring node")
 
     try:
-        # Initialize workbench if this is the first run
-        if state["source_cv"] is None:
-            state["source_cv"] = state["tailored_cv"]
-            state["tailored_cv"] = state["tailored_cv"].model_copy(deep=True)
-            # Clear experience entries in tailored_cv to build them iteratively
-            for section in state["tailored_cv"].sections:
-                if section.name == "Experience":
-                    section.entries = []
+        # Initialize workbench if this is the first run. The node stays free
+        # of state writes: the init values live in locals and are carried to
+        # the caller through the returned delta.
+        source_cv = state["source_cv"]
+        tailored_cv = state["tailored_cv"]
+        init_update: Dict[str, Any] = {}
+        if source_cv is None:
+            source_cv = tailored_cv
+            # Rebuild with an emptied Experience slot to fill iteratively;
+            # personal_info and the untouched sections are shared by reference
+            tailored_cv = _with_sections(
+                tailored_cv,
+                [
+                    Section.model_construct(name=s.name, entries=[])
+                    if s.name == "Experience"
+                    else s
+                    for s in tailored_cv.sections
+                ],
+            )
+            init_update = {"source_cv": source_cv, "tailored_cv": tailored_cv}
+
+        # Use the views precomputed during section mapping when available;
+        # fall back to the section index for states that skipped that node
+        qualifications_context = state.get("qualifications_titles")
+        if qualifications_context is None:
+            qualifications_section = source_cv.get_section("qualifications")
+            qualifications_context = (
+                [entry.title for entry in qualifications_section.entries]
+                if qualifications_section else []
+            )
 
-        # Extract qualifications from the enriched CV for context
-        qualifications_context = []
-        for section in state["source_cv"].sections:
-            if "qualifications" in section.name.lower():
-                qualifications_context = [entry.title for entry in section.entries]
-                break
-
-        # Find the experience section in source CV
-        source_experience_entries = []
-        for section in state["source_cv"].sections:
-            if section.name == "Experience":
-                source_experience_entries = section.entries
-                break
+        source_experience_entries = state.get("source_experience_entries")
+        if source_experience_entries is None:
+            source_experience_section = source_cv.get_section("experience")
+            source_experience_entries = (
+                source_experience_section.entries if source_experience_section else []
+            )
 
         # Check if we have more entries to process
         current_index = state["experience_index"]
         if current_index >= len(source_experience_entries):
             logger.info("All experience entries have been processed")
             return {
-                "tailored_cv": state["tailored_cv"],
+                **init_update,
+                "tailored_cv": tailored_cv,
                 "current_step": "experience_tailoring_complete",
             }
 
@@ -300,76 +449,61 @@ def tailor_experience_node(state: AppState) -> Dict[str, Any]:
 
         # Check if user wants to skip this entry (keep original)
         if state.get("user_intent") == "skip":
-            logger.info(f"User chose to skip entry {current_index + 1}, keeping original")
+            logger.info("User chose to skip entry %d, keeping original", current_index + 1)
+            # If the original entry is already in place (a repeated skip or a
+            # UI rerun), the CV needs no rebuilding at all
+            existing_section = tailored_cv.get_section("experience")
+            if (
+                existing_section is not None
+                and current_index < len(existing_section.entries)
+                and existing_section.entries[current_index] is current_entry
+            ):
+                return {
+                    **init_update,
+                    "current_step": "experience_entry_tailored",
+                    "user_intent": None,
+                }
             tailored_entry = current_entry  # Use original entry as-is
         else:
             # Tailor the current entry
             chain = create_experience_tailoring_chain()
-            result = chain.invoke(
-                {
-                    "job_description": state["raw_job_description"],
-                    "current_entry": {
-                        "title": current_entry.title,
-                        "subtitle": current_entry.subtitle,
-                        "date_range": current_entry.date_range,
-                        "details": current_entry.details,
-                        "tags": current_entry.tags,
-                    },
-                    "key_qualifications": str(qualifications_context),
-                }
-            )
-            tailored_entry = result.tailored_entry
-
-        # Functional approach: Create new StructuredCV with updated Experience section
-
-        # Find existing Experience section or create new one
-        experience_section = None
-        other_sections = []
-
-        for section in state["tailored_cv"].sections:
-            if section.name == "Experience":
-                experience_section = section
-            else:
-                other_sections.append(section)
-
-        # Create new Experience section with the tailored entry added
-        from models import Section, StructuredCV
+            chain_input = {
+                "job_description": state["raw_job_description"],
+                "current_entry": current_entry.model_dump_json(),
+                "key_qualifications": json.dumps(qualifications_context),
+            }
 
-        if experience_section is None:
-            # No existing Experience section - create new one
-            new_experience_section = Section(
-                name="Experience", entries=[tailored_entry]
-            )
-        else:
-            # Check if this is a revision (entry already exists at current index)
-            if current_index < len(experience_section.entries):
-                # This is a revision - replace the existing entry
-                new_entries = experience_section.entries.copy()
-                new_entries[current_index] = tailored_entry
-                logger.info(f"Replacing existing entry at index {current_index} during revision")
-            else:
-                # This is first-time generation - append the new entry
-                new_entries = experience_section.entries + [tailored_entry]
-                logger.info(f"Appending new entry at index {current_index}")
+            # Include human feedback if this is a regeneration; it also keys
+            # the response cache, so a revision is never served the cached
+            # result of the call it is revising
+            if state.get("human_approved") == False and state.get("human_feedback"):
+                chain_input["human_feedback"] = state["human_feedback"]
+                logger.info("Including human feedback in regeneration: %.100s...", state["human_feedback"])
 
-            new_experience_section = Section(name="Experience", entries=new_entries)
+            result = chain.invoke(chain_input)
+            tailored_entry = result.tailored_entry
 
-        # Create new StructuredCV with updated sections
-        new_sections = other_sections + [new_experience_section]
-        new_tailored_cv = StructuredCV(
-            personal_info=state["tailored_cv"].personal_info, sections=new_sections
+        # Functional approach: Create new StructuredCV with the tailored entry
+        # upserted into the Experience section, sharing the untouched sections
+        new_tailored_cv = _upsert_entry(
+            tailored_cv, "Experience", tailored_entry, current_index
         )
 
         logger.info(
-            f"Experience entry {current_index + 1} processed successfully: {tailored_entry.title}"
+            "Experience entry %d processed successfully: %s",
+            current_index + 1,
+            tailored_entry.title,
         )
         return {
+            **init_update,
             "tailored_cv": new_tailored_cv,
             "current_step": "experience_entry_tailored",
             "user_intent": None,  # Clear the user intent flag
+            "human_approved": None,  # Clear the approval flag
+            "human_feedback": None,  # Clear the feedback
         }
     except Exception as e:
-        logger.error(f"Experience tailoring failed: {str(e)}")
+        logger.error("Experience tailoring failed: %s", e)
         return {
             "error_message": f"Failed to tailor experience entry: {str(e)}",
             "current_step": "experience_tailoring_failed",
@@ -385,19 +519,22 @@ def should_continue_experience_node(state: AppState) -> Dict[str, Any]:
     logger.info("Checking if more experience entries need processing")
 
     try:
-        # Get source experience entries count
+        # Get source experience entries count, preferring the precomputed view
         source_experience_count = 0
-        if state["source_cv"] is not None:
-            for section in state["source_cv"].sections:
-                if section.name == "Experience":
-                    source_experience_count = len(section.entries)
-                    break
+        if state.get("source_experience_entries") is not None:
+            source_experience_count = len(state["source_experience_entries"])
+        elif state["source_cv"] is not None:
+            experience_section = state["source_cv"].get_section("experience")
+            if experience_section:
+                source_experience_count = len(experience_section.entries)
 
         current_index = state["experience_index"]
 
         if current_index < source_experience_count:
             logger.info(
-                f"More experience entries to process: {current_index}/{source_experience_count}"
+                "More experience entries to process: %d/%d",
+                current_index,
+                source_experience_count,
             )
             return {
                 "current_step": "awaiting_experience_review",
@@ -412,7 +549,7 @@ def should_continue_experience_node(state: AppState) -> Dict[str, Any]:
                 "experience_index": current_index  # Explicitly pass the final index
             }
     except Exception as e:
-        logger.error(f"Experience tailoring failed: {str(e)}")
+        logger.error("Experience tailoring failed: %s", e)
         return {
             "error_message": f"Failed to tailor experience: {str(e)}",
             "current_step": "experience_tailoring_failed",
@@ -428,113 +565,117 @@ def tailor_project_entry_node(state: AppState) -> Dict[str, Any]:
     logger.info("Starting iterative project tailoring node")
 
     try:
-        # Initialize workbench if this is the first run
-        if state["source_cv"] is None:
-            state["source_cv"] = state["tailored_cv"]
-            state["tailored_cv"] = state["tailored_cv"].model_copy(deep=True)
-            # Clear project entries in tailored_cv to build them iteratively
-            for section in state["tailored_cv"].sections:
-                if section.name == "Projects":
-                    section.entries = []
-
-        # Extract qualifications from the enriched CV for context
-        qualifications_context = []
-        for section in state["source_cv"].sections:
-            if "qualifications" in section.name.lower():
-                qualifications_context = [entry.title for entry in section.entries]
-                break
-
-        # Find the projects section in source CV
-        source_project_entries = []
-        for section in state["source_cv"].sections:
-            if section.name == "Projects":
-                source_project_entries = section.entries
-                break
+        # Initialize workbench if this is the first run. The node stays free
+        # of state writes: the init values live in locals and are carried to
+        # the caller through the returned delta.
+        source_cv = state["source_cv"]
+        tailored_cv = state["tailored_cv"]
+        init_update: Dict[str, Any] = {}
+        if source_cv is None:
+            source_cv = tailored_cv
+            # Rebuild with an emptied Projects slot to fill iteratively;
+            # personal_info and the untouched sections are shared by reference
+            tailored_cv = _with_sections(
+                tailored_cv,
+                [
+                    Section.model_construct(name=s.name, entries=[])
+                    if s.name == "Projects"
+                    else s
+                    for s in tailored_cv.sections
+                ],
+            )
+            init_update = {"source_cv": source_cv, "tailored_cv": tailored_cv}
+
+        # Find the project entries first: CVs without projects (or with all
+        # entries processed) bail out here before any context building is
+        # done. Views precomputed during section mapping are preferred; the
+        # fallback uses the section index for states that skipped that node.
+        source_project_entries = state.get("source_project_entries")
+        if source_project_entries is None:
+            source_projects_section = source_cv.get_section("projects")
+            source_project_entries = (
+                source_projects_section.entries if source_projects_section else []
+            )
 
         # Check if we have more entries to process
         current_index = state.get("project_index", 0)
         if current_index >= len(source_project_entries):
             logger.info("All project entries have been processed")
             return {
-                "tailored_cv": state["tailored_cv"],
+                **init_update,
+                "tailored_cv": tailored_cv,
                 "current_step": "projects_tailoring_complete",
             }
 
+        # Extract qualifications from the enriched CV for context
+        qualifications_context = state.get("qualifications_titles")
+        if qualifications_context is None:
+            qualifications_section = source_cv.get_section("qualifications")
+            qualifications_context = (
+                [entry.title for entry in qualifications_section.entries]
+                if qualifications_section else []
+            )
+
         # Get the current entry to process
         current_entry = source_project_entries[current_index]
 
         # Check if user wants to skip this entry (keep original)
         if state.get("user_intent") == "skip":
-            logger.info(f"User chose to skip entry {current_index + 1}, keeping original")
+            logger.info("User chose to skip entry %d, keeping original", current_index + 1)
+            # If the original entry is already in place (a repeated skip or a
+            # UI rerun), the CV needs no rebuilding at all
+            existing_section = tailored_cv.get_section("projects")
+            if (
+                existing_section is not None
+                and current_index < len(existing_section.entries)
+                and existing_section.entries[current_index] is current_entry
+            ):
+                return {
+                    **init_update,
+                    "current_step": "project_entry_tailored",
+                    "user_intent": None,
+                }
             tailored_entry = current_entry  # Use original entry as-is
         else:
             # Tailor the current entry
             chain = create_projects_tailoring_chain()
-            result = chain.invoke(
-                {
-                    "job_description": state["raw_job_description"],
-                    "current_entry": {
-                        "title": current_entry.title,
-                        "subtitle": current_entry.subtitle,
-                        "date_range": current_entry.date_range,
-                        "details": current_entry.details,
-                        "tags": current_entry.tags,
-                    },
-                    "key_qualifications": str(qualifications_context),
-                }
-            )
-            tailored_entry = result.tailored_entry
-
-        # Functional approach: Create new StructuredCV with updated Projects section
-
-        # Find existing Projects section or create new one
-        projects_section = None
-        other_sections = []
-
-        for section in state["tailored_cv"].sections:
-            if section.name == "Projects":
-                projects_section = section
-            else:
-                other_sections.append(section)
+            chain_input = {
+                "job_description": state["raw_job_description"],
+                "current_entry": current_entry.model_dump_json(),
+                "key_qualifications": json.dumps(qualifications_context),
+            }
 
-        # Create new Projects section with the tailored entry added
-        from models import Section, StructuredCV
+            # Include human feedback if this is a regeneration; it also keys
+            # the response cache, so a revision is never served the cached
+            # result of the call it is revising
+            if state.get("human_approved") == False and state.get("human_feedback"):
+                chain_input["human_feedback"] = state["human_feedback"]
+                logger.info("Including human feedback in regeneration: %.100s...", state["human_feedback"])
 
-        if projects_section is None:
-            # No existing Projects section - create new one
-            new_projects_section = Section(
-                name="Projects", entries=[tailored_entry]
-            )
-        else:
-            # Check if this is a revision (entry already exists at current index)
-            if current_index < len(projects_section.entries):
-                # This is a revision - replace the existing entry
-                new_entries = projects_section.entries.copy()
-                new_entries[current_index] = tailored_entry
-                logger.info(f"Replacing existing entry at index {current_index} during revision")
-            else:
-                # This is first-time generation - append the new entry
-                new_entries = projects_section.entries + [tailored_entry]
-                logger.info(f"Appending new entry at index {current_index}")
-
-            new_projects_section = Section(name="Projects", entries=new_entries)
+            result = chain.invoke(chain_input)
+            tailored_entry = result.tailored_entry
 
-        # Create new StructuredCV with updated sections
-        new_sections = other_sections + [new_projects_section]
-        new_tailored_cv = StructuredCV(
-            personal_info=state["tailored_cv"].personal_info, sections=new_sections
+        # Functional approach: Create new StructuredCV with the tailored entry
+        # upserted into the Projects section, sharing the untouched sections
+        new_tailored_cv = _upsert_entry(
+            tailored_cv, "Projects", tailored_entry, current_index
         )
 
         logger.info(
-            f"Project entry {current_index + 1} processed successfully: {tailored_entry.title}"
+            "Project entry %d processed successfully: %s",
+            current_index + 1,
+            tailored_entry.title,
         )
         return {
+            **init_update,
             "tailored_cv": new_tailored_cv,
             "current_step": "project_entry_tailored",
             "user_intent": None,  # Clear the user intent flag
+            "human_approved": None,  # Clear the approval flag
+            "human_feedback": None,  # Clear the feedback
         }
     except Exception as e:
-        logger.error(f"Project tailoring failed: {str(e)}")
+        logger.error("Project tailoring failed: %s", e)
         return {
             "error_message": f"Failed to tailor project entry: {str(e)}",
             "current_step": "project_tailoring_failed",
@@ -550,19 +691,22 @@ def should_continue_projects_node(state: AppState) -> Dict[str, Any]:
     logger.info("Checking if more project entries need processing")
 
     try:
-        # Get source project entries count
+        # Get source project entries count, preferring the precomputed view
         source_project_count = 0
-        if state["source_cv"] is not None:
-            for section in state["source_cv"].sections:
-                if section.name == "Projects":
-                    source_project_count = len(section.entries)
-                    break
+        if state.get("source_project_entries") is not None:
+            source_project_count = len(state["source_project_entries"])
+        elif state["source_cv"] is not None:
+            projects_section = state["source_cv"].get_section("projects")
+            if projects_section:
+                source_project_count = len(projects_section.entries)
 
         current_index = state.get("project_index", 0)
 
         if current_index < source_project_count:
             logger.info(
-                f"More project entries to process: {current_index}/{source_project_count}"
+                "More project entries to process: %d/%d",
+                current_index,
+                source_project_count,
             )
             return {
                 "current_step": "awaiting_project_review",
@@ -575,7 +719,7 @@ def should_continue_projects_node(state: AppState) -> Dict[str, Any]:
                 "current_step": "start_summary_generation",
             }
     except Exception as e:
-        logger.error(f"Project tailoring failed: {str(e)}")
+        logger.error("Project tailoring failed: %s", e)
         return {
             "error_message": f"Failed to tailor projects: {str(e)}",
             "current_step": "project_tailoring_failed",
@@ -597,48 +741,41 @@ def generate_executive_summary_node(state: AppState) -> Dict[str, Any]:
         # If this is a regeneration (human_approved=False), remove existing summary
         if state.get("human_approved") == False:
             logger.info("Regenerating executive summary based on user feedback")
-            cv_data = cv_data.model_copy(deep=True)
-            cv_data.sections = [s for s in cv_data.sections if "summary" not in s.name.lower()]
-
-        # Use the complete enriched CV as context - no need to extract separately
-        # The CV now contains all the tailored content from previous steps
-        complete_cv_context = {
-            "sections": [
-                {
-                    "title": section.name,
-                    "entries": [
-                        {
-                            "title": entry.title,
-                            "subtitle": entry.subtitle,
-                            "details": entry.details,
-                            "tags": entry.tags,
-                        }
-                        for entry in section.entries
-                    ],
+            cv_data = _drop_section(cv_data, "summary")
+
+        # Use the complete enriched CV as context - no need to extract
+        # separately. The CV now contains all the tailored content from
+        # previous steps; a single filtered model_dump_json serializes it in
+        # one pass instead of rebuilding the tree as dicts and re-walking it.
+        enriched_cv_json = cv_data.model_dump_json(
+            include={
+                "sections": {
+                    "__all__": {
+                        "name": True,
+                        "entries": {"__all__": {"title", "subtitle", "details", "tags"}},
+                    }
                 }
-                for section in cv_data.sections
-            ]
-        }
+            }
+        )
 
         chain = create_executive_summary_chain()
 
         # Include human feedback if this is a regeneration
         chain_input = {
             "job_description": state["raw_job_description"],
-            "enriched_cv": str(complete_cv_context),  # Pass the complete enriched CV
+            "enriched_cv": enriched_cv_json,  # Pass the complete enriched CV
         }
 
         if state.get("human_approved") == False and state.get("human_feedback"):
             chain_input["human_feedback"] = state["human_feedback"]
-            logger.info(f"Including human feedback in summary regeneration: {state['human_feedback'][:100]}...")
+            logger.info("Including human feedback in summary regeneration: %.100s...", state["human_feedback"])
 
         result = chain.invoke(chain_input)
 
         # LIVING DOCUMENT PATTERN: Add executive summary directly to tailored_cv
-        from models import Section, CVEntry
-
         # Create executive summary section
-        summary_entry = CVEntry(
+        # Trusted, internally-built values: model_construct skips validation
+        summary_entry = CVEntry.model_construct(
             title="Executive Summary",
             subtitle=None,
             date_range=None,
@@ -646,14 +783,15 @@ def generate_executive_summary_node(state: AppState) -> Dict[str, Any]:
             tags=[],
         )
 
-        summary_section = Section(name="Executive Summary", entries=[summary_entry])
+        summary_section = Section.model_construct(name="Executive Summary", entries=[summary_entry])
 
-        # Create final CV with summary at the very beginning
-        final_cv = cv_data.model_copy(deep=True)
-        final_cv.sections.insert(0, summary_section)
+        # Create final CV with summary at the very beginning, sharing the
+        # existing sections instead of deep-copying them
+        final_cv = _with_sections(cv_data, [summary_section, *cv_data.sections])
 
         logger.info(
-            f"Executive summary generation successful. Summary length: {len(result.summary)} characters. Added to tailored_cv."
+            "Executive summary generation successful. Summary length: %d characters. Added to tailored_cv.",
+            len(result.summary),
         )
         return {
             "tailored_cv": final_cv,
@@ -662,7 +800,7 @@ def generate_executive_summary_node(state: AppState) -> Dict[str, Any]:
             "human_feedback": None,  # Clear the feedback
         }
     except Exception as e:
-        logger.error(f"Executive summary generation failed: {str(e)}")
+        logger.error("Executive summary generation failed: %s", e)
         return {
             "error_message": f"Failed to generate executive summary: {str(e)}",
             "current_step": "summary_generation_failed",
@@ -695,7 +833,7 @@ def finalize_cv_node(state: AppState) -> dict:
         for section in source_cv.sections:
             # FIRST, check if this is the old skills section and skip it
             if "skills" in section.name.lower():
-                logger.info(f"Skipping original '{section.name}' section.")
+                logger.info("Skipping original '%s' section.", section.name)
                 continue
 
             # NEXT, check if a tailored version of this section exists
@@ -719,7 +857,7 @@ def finalize_cv_node(state: AppState) -> dict:
             "workflow_complete": True,
         }
     except Exception as e:
-        logger.error(f"CV finalization failed: {str(e)}")
+        logger.error("CV finalization failed: %s", e)
         return {
             "error_message": f"Failed to finalize CV: {str(e)}",
             "current_step": "cv_finalization_failed",
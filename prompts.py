@@ -8,9 +8,6 @@ as constants.
 JOB_DESCRIPTION_PARSING_PROMPT = """
 You are an expert HR analyst. Parse the following job description and extract structured information.
 
-Job Description:
-{job_description}
-
 Extract:
 1. Job title
 2. Company name (if mentioned)
@@ -21,6 +18,9 @@ Extract:
 7. Industry or domain
 
 Be thorough and accurate in your extraction.
+
+Job Description:
+{job_description}
 """
 
 KEY_QUALIFICATIONS_PROMPT = """
@@ -34,7 +34,7 @@ You are an expert CV and LinkedIn profile skill generator. Your goal is to analy
 
 3. **Synthesize and Condense:** Rephrase the skills to be concise and impactful. Aim for action-oriented phrases that highlight capabilities. Each skill phrase should be **no longer than 30 characters**.
 
-4. **Format Output:** Return the skills as a valid JSON object with the exact structure shown below. Do not include any additional text, explanations, or formatting outside the JSON.
+4. **Format Output:** Fill the `qualifications` field of the structured output with the 8 skill phrases, e.g. "Data Analysis & Insights", "Python for Machine Learning".
 
 5. **Generate the "Big 8" Skills:** Create exactly 8 skills that are:
     * Highly relevant to the job description.
@@ -49,39 +49,17 @@ You are an expert CV and LinkedIn profile skill generator. Your goal is to analy
 {current_skills}
 
 {human_feedback_section}
-
-[Required JSON Output Format]
-You must return ONLY a valid JSON object with this exact structure:
-
-```json
-{{
-  "qualifications": [
-    "Data Analysis & Insights",
-    "Python for Machine Learning",
-    "Strategic Business Planning",
-    "Cloud Infrastructure Management",
-    "Agile Project Leadership",
-    "Advanced SQL & Database Design",
-    "Cross-Functional Communication",
-    "MLOps & Model Deployment"
-  ]
-}}
-```
-
-**CRITICAL:** Return ONLY the JSON object above. Do not include any explanatory text, markdown formatting, or anything outside of the JSON object.
 """
 
+# NOTE: These templates are ordered for provider-side prefix caching: the
+# static instructions come first, the inputs that are stable within one
+# workflow run (job description, qualifications) come next, and the content
+# that varies per call (entry, feedback) comes last, so successive calls share
+# the longest possible prompt prefix.
+
 EXECUTIVE_SUMMARY_PROMPT = """
 You are an expert CV writer. Create a compelling executive summary for this candidate using their complete, tailored CV.
 
-Job Description:
-{job_description}
-
-Candidate's Complete Enriched CV:
-{enriched_cv}
-
-{human_feedback_section}
-
 Write a 3-4 sentence executive summary that:
 1. Opens with the candidate's professional identity
 2. Highlights years of experience and key expertise from their tailored experience
@@ -89,19 +67,18 @@ Write a 3-4 sentence executive summary that:
 4. Concludes with value proposition for this specific role
 
 Use the enriched CV content (qualifications, tailored experience, tailored projects) to create the most compelling and accurate summary.
-"""
-
-EXPERIENCE_TAILORING_PROMPT = """
-You are an expert CV writer. Tailor this single work experience entry for the specific job using the candidate's key qualifications as context.
 
-Target Job:
+Job Description:
 {job_description}
 
-Candidate's Key Qualifications (for context):
-{key_qualifications}
+Candidate's Complete Enriched CV:
+{enriched_cv}
 
-Current Experience Entry to Tailor:
-{current_entry}
+{human_feedback_section}
+"""
+
+EXPERIENCE_TAILORING_PROMPT = """
+You are an expert CV writer. Tailor this single work experience entry for the specific job using the candidate's key qualifications as context.
 
 For this experience entry:
 1. Emphasize responsibilities that match the job requirements and align with the key qualifications
@@ -119,10 +96,6 @@ Return the tailored entry as a CVEntry object with:
 - tags: List of relevant skills/technologies
 
 Maintain truthfulness while optimizing for relevance and coherence with qualifications.
-"""
-
-PROJECTS_TAILORING_PROMPT = """
-You are an expert CV writer. Tailor this single project entry for the specific job using the candidate's key qualifications as context.
 
 Target Job:
 {job_description}
@@ -130,9 +103,15 @@ Target Job:
 Candidate's Key Qualifications (for context):
 {key_qualifications}
 
-Current Project Entry to Tailor:
+Current Experience Entry to Tailor:
 {current_entry}
 
+{human_feedback_section}
+"""
+
+PROJECTS_TAILORING_PROMPT = """
+You are an expert CV writer. Tailor this single project entry for the specific job using the candidate's key qualifications as context.
+
 For this project entry:
 1. Highlight technologies and skills that match job requirements and align with the key qualifications
 2. Emphasize outcomes and impact that demonstrate relevant capabilities
@@ -149,6 +128,17 @@ Return the tailored entry as a CVEntry object with:
 - tags: List of relevant technologies/skills
 
 Maintain truthfulness while optimizing for relevance and coherence with qualifications.
+
+Target Job:
+{job_description}
+
+Candidate's Key Qualifications (for context):
+{key_qualifications}
+
+Current Project Entry to Tailor:
+{current_entry}
+
+{human_feedback_section}
 """
 
 CV_PARSING_PROMPT = """You are an expert CV parser. Extract information from the CV text and return ONLY a valid JSON object.
@@ -158,46 +148,11 @@ CRITICAL REQUIREMENTS:
 2. Every entry MUST have a "title" field - this is required
 3. personal_info must be a JSON object with separate fields for name, email, phone
 4. Use null for optional fields that are empty
-5. MANDATORY SECTION NAMING: When you find work experience/employment history, the section name MUST be exactly "Experience"
-6. MANDATORY SECTION NAMING: When you find projects/portfolio work, the section name MUST be exactly "Projects"
+5. MANDATORY SECTION NAMING: work experience/employment history MUST be named exactly "Experience"; projects/portfolio work MUST be named exactly "Projects". Use "Education", "Skills", "Certifications", "Languages" for the other standard sections.
 
 JSON STRUCTURE:
-{{
-  "personal_info": {{
-    "name": "Full Name",
-    "email": "email@example.com",
-    "phone": "phone number"
-  }},
-  "sections": [
-    {{
-      "name": "Experience",
-      "entries": [
-        {{
-          "title": "Job Title",
-          "subtitle": "Company Name",
-          "date_range": "2020-2023",
-          "details": ["Achievement 1", "Achievement 2"],
-          "tags": ["Skill1", "Skill2"]
-        }}
-      ]
-    }}
-  ]
-}}
-
-SECTION NAMING GUIDE:
-- Work experience/employment history → MUST use "Experience"
-- Projects/portfolio work → MUST use "Projects"
-- Education/academic background → Use "Education"
-- Skills/technical abilities → Use "Skills"
-- Certifications → Use "Certifications"
-- Languages → Use "Languages"
-
-TITLE EXAMPLES:
-- Experience: "Data Scientist", "Software Engineer"
-- Education: "Master of Science in Data Science", "Bachelor of Computer Science"
-- Skills: "Technical Skills", "Programming Languages"
-- Certifications: "Google Analytics Certified", "AWS Solutions Architect"
-- Languages: "Languages"
+{{"personal_info": {{"name": "Full Name", "email": "email@example.com", "phone": "phone number"}},
+ "sections": [{{"name": "Experience", "entries": [{{"title": "Job Title", "subtitle": "Company Name", "date_range": "2020-2023", "details": ["Achievement 1"], "tags": ["Skill1"]}}]}}]}}
 
 CV Text to parse:
 {cv_text}
@@ -208,24 +163,16 @@ SECTION_MAPPING_PROMPT = """
 You are an expert CV analyst tasked with mapping ambiguous sections to standardized concepts.
 Analyze the following CV, provided as a JSON object. Your goal is to identify which section index corresponds to the concepts of "executive summary" and "qualifications".
 
-The CV JSON object:
-{source_cv_json}
-
 **Instructions:**
 1.  **Executive Summary:** Find the section that acts as a professional summary, profile, or objective. This is usually a short, paragraph-style section near the top of the CV.
 2.  **Qualifications/Skills:** Find the section that lists the candidate's skills, technologies, or core competencies. It might be called "Skills", "Technical Skills", "Key Qualifications", etc.
 3.  **Determine the Index:** Identify the 0-based index of these sections within the main `sections` array of the JSON.
-4.  **Return JSON:** You MUST return ONLY a single, valid JSON object with the following keys:
+4.  **Fill the Output Fields:**
     - `executive_summary_source_index`: The integer index of the summary/profile section. If no such section is found, the value must be `null`.
     - `qualifications_source_index`: The integer index of the skills/qualifications section. If no such section is found, the value must be `null`.
 
-**Example Output:**
-{{
-  "executive_summary_source_index": 0,
-  "qualifications_source_index": 4
-}}
-
-**CRITICAL:** Do not include any explanations, markdown, or any text outside of the single JSON object in your response.
+The CV JSON object:
+{source_cv_json}
 """
 
 LATEX_FIXER_PROMPT = """You are an expert LaTeX debugger. A user's LaTeX code failed to compile.
@@ -5,9 +5,10 @@ for all application state. Following the constitutional rules, this is the begin
 and end of all state in the application.
 """
 
-from typing import TypedDict
+from functools import lru_cache
+from typing import List, TypedDict
 from typing_extensions import NotRequired
-from models import JobDescriptionData, StructuredCV, SectionMap
+from models import CVEntry, JobDescriptionData, StructuredCV, SectionMap
 
 
 class AppState(TypedDict):
@@ -31,6 +32,17 @@ class AppState(TypedDict):
     experience_index: NotRequired[int]           # Current experience entry for iterative review
     project_index: NotRequired[int]            # Current project for iterative review
 
+    # Precomputed read-only views over source_cv (set during section mapping)
+    # so the per-entry tailoring nodes don't rescan sections on every call
+    qualifications_titles: NotRequired[List[str]]
+    source_experience_entries: NotRequired[List[CVEntry]]
+    source_project_entries: NotRequired[List[CVEntry]]
+
+    # Serialized qualification-prompt inputs, cached on first generation and
+    # reused verbatim across regeneration loops (only the feedback changes)
+    job_requirements_json: NotRequired[str]
+    current_skills_json: NotRequired[str]
+
     # Final output
     final_cv: NotRequired[StructuredCV]
 
@@ -53,18 +65,22 @@ class AppState(TypedDict):
     latex_error_log: NotRequired[str]
 
 
+@lru_cache(maxsize=None)
+def _read_default_file(path: str) -> str:
+    """Read a default input file once per process; fresh sessions reuse it."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
 def get_initial_state() -> AppState:
     """Create initial application state with default values.
 
     Returns:
         AppState: Initial state with default CV and JD loaded
     """
-    # Read default files
-    with open("test-cv.txt", "r", encoding="utf-8", errors="replace") as f:
-        default_cv = f.read()
-
-    with open("test-jd.txt", "r", encoding="utf-8", errors="replace") as f:
-        default_jd = f.read()
+    # Read default files (cached across session restarts)
+    default_cv = _read_default_file("test-cv.txt")
+    default_jd = _read_default_file("test-jd.txt")
 
     return {
         "raw_cv_text": default_cv,
@@ -2,15 +2,21 @@
 
 import pytest
 from unittest.mock import Mock, patch
+import graph
 from graph import workflow_router, run_graph_step, create_cv_generation_graph
 from state import AppState
 from models import StructuredCV, Section, CVEntry
 from langgraph.graph import END
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_app_state() -> AppState:
-    """Create a base AppState for testing."""
+    """Create a shared base AppState for testing.
+
+    Module-scoped so the two StructuredCV instances are built once for the
+    whole file instead of once per test; tests must not mutate it and
+    instead derive per-test variants via dict(base_app_state, ...).
+    """
     return {
         "current_step": "parse_cv",
         "cv_text": "Sample CV text",
@@ -36,116 +42,97 @@ class TestWorkflowRouter:
     
     def test_router_input_to_parse_jd(self, base_app_state):
         """Test routing from input state to parse job description."""
-        base_app_state["current_step"] = "input"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="input"))
         assert result == "parse_job_description"
     
     def test_router_jd_parsed_to_parse_cv(self, base_app_state):
         """Test routing from job description parsed to parse CV."""
-        base_app_state["current_step"] = "job_description_parsed"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="job_description_parsed"))
         assert result == "parse_cv"
     
     def test_router_cv_parsed_to_setup_iterative_session(self, base_app_state):
         """Test routing from CV parsed to setup iterative session."""
-        base_app_state["current_step"] = "cv_parsed"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="cv_parsed"))
         assert result == "setup_iterative_session"
     
     def test_router_iterative_session_ready_to_map_source_sections(self, base_app_state):
         """Test routing from iterative session ready to map source sections."""
-        base_app_state["current_step"] = "iterative_session_ready"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="iterative_session_ready"))
         assert result == "map_source_sections"
     
     def test_router_sections_mapped_to_generate_qualifications(self, base_app_state):
         """Test routing from sections mapped to generate qualifications."""
-        base_app_state["current_step"] = "sections_mapped"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="sections_mapped"))
         assert result == "generate_qualifications"
     
     def test_router_qualifications_approved_to_tailor_experience(self, base_app_state):
         """Test routing from qualifications approved to tailor experience."""
-        base_app_state["current_step"] = "qualifications_approved"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="qualifications_approved"))
         assert result == "tailor_experience"
     
     def test_router_start_experience_tailoring_to_tailor_experience(self, base_app_state):
         """Test routing from start experience tailoring to tailor experience."""
-        base_app_state["current_step"] = "start_experience_tailoring"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="start_experience_tailoring"))
         assert result == "tailor_experience"
     
     def test_router_experience_entry_tailored_to_should_continue(self, base_app_state):
         """Test routing from experience entry tailored to should continue decision."""
-        base_app_state["current_step"] = "experience_entry_tailored"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="experience_entry_tailored"))
         assert result == "should_continue_experience"
     
     def test_router_continue_experience_tailoring_to_tailor_experience(self, base_app_state):
         """Test routing from continue experience tailoring back to tailor experience."""
-        base_app_state["current_step"] = "continue_experience_tailoring"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="continue_experience_tailoring"))
         assert result == "tailor_experience"
     
     def test_router_experience_tailoring_complete_to_tailor_projects(self, base_app_state):
         """Test routing from experience tailoring complete to tailor project entry."""
-        base_app_state["current_step"] = "experience_tailoring_complete"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="experience_tailoring_complete"))
         assert result == "tailor_project_entry"
     
     def test_router_start_projects_tailoring_to_tailor_projects(self, base_app_state):
         """Test routing from start projects tailoring to tailor project entry."""
-        base_app_state["current_step"] = "start_projects_tailoring"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="start_projects_tailoring"))
         assert result == "tailor_project_entry"
     
     def test_router_project_entry_tailored_to_should_continue(self, base_app_state):
         """Test routing from project entry tailored to should continue projects."""
-        base_app_state["current_step"] = "project_entry_tailored"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="project_entry_tailored"))
         assert result == "should_continue_projects"
     
     def test_router_continue_projects_tailoring_to_tailor_project_entry(self, base_app_state):
         """Test routing from continue projects tailoring to tailor project entry."""
-        base_app_state["current_step"] = "continue_projects_tailoring"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="continue_projects_tailoring"))
         assert result == "tailor_project_entry"
     
     def test_router_projects_tailoring_complete_to_generate_summary(self, base_app_state):
         """Test routing from projects tailoring complete to generate summary."""
-        base_app_state["current_step"] = "projects_tailoring_complete"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="projects_tailoring_complete"))
         assert result == "generate_summary"
     
     def test_router_start_summary_generation_to_generate_summary(self, base_app_state):
         """Test routing from start summary generation to generate summary."""
-        base_app_state["current_step"] = "start_summary_generation"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="start_summary_generation"))
         assert result == "generate_summary"
     
     def test_router_summary_approved_to_finalize_cv(self, base_app_state):
         """Test routing from summary approved to finalize CV."""
-        base_app_state["current_step"] = "summary_approved"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="summary_approved"))
         assert result == "finalize_cv"
     
     def test_router_start_cv_finalization_to_finalize_cv(self, base_app_state):
         """Test routing from start CV finalization to finalize CV."""
-        base_app_state["current_step"] = "start_cv_finalization"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="start_cv_finalization"))
         assert result == "finalize_cv"
     
     def test_router_cv_finalized_to_end(self, base_app_state):
         """Test routing from CV finalized to END."""
-        base_app_state["current_step"] = "cv_finalized"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="cv_finalized"))
         assert result == END
     
     def test_router_cv_parsing_failed_to_end(self, base_app_state):
         """Test routing from CV parsing failed to END."""
-        base_app_state["current_step"] = "cv_parsing_failed"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="cv_parsing_failed"))
         assert result == END
     
     def test_router_awaiting_states_to_end(self, base_app_state):
@@ -159,26 +146,31 @@ class TestWorkflowRouter:
         ]
         
         for state_name in awaiting_states:
-            base_app_state["current_step"] = state_name
-            result = workflow_router(base_app_state)
+            result = workflow_router(dict(base_app_state, current_step=state_name))
             assert result == END, f"State {state_name} should route to END"
     
     def test_router_unknown_state_to_end(self, base_app_state):
         """Test that unknown states route to END."""
-        base_app_state["current_step"] = "unknown_state"
-        result = workflow_router(base_app_state)
+        result = workflow_router(dict(base_app_state, current_step="unknown_state"))
         assert result == END
     
     def test_router_missing_current_step_defaults_to_input(self, base_app_state):
         """Test that missing current_step defaults to input routing."""
-        del base_app_state["current_step"]
-        result = workflow_router(base_app_state)
+        state = {k: v for k, v in base_app_state.items() if k != "current_step"}
+        result = workflow_router(state)
         assert result == "parse_job_description"
 
 
 class TestRunGraphStep:
     """Test the run_graph_step function."""
-    
+
+    @pytest.fixture(autouse=True)
+    def reset_compiled_graph(self):
+        """Clear the compiled-graph singleton so each test hits its own mock."""
+        graph._COMPILED_GRAPH = None
+        yield
+        graph._COMPILED_GRAPH = None
+
     @patch('graph.create_cv_generation_graph')
     def test_run_graph_step_success(self, mock_create_graph, base_app_state):
         """Test successful graph step execution."""
@@ -0,0 +1,226 @@
+"""Shared review renderer for the per-entry tailoring screens.
+
+The experience and projects review screens are the same two-column
+original-vs-tailored layout with identical Approve/Revise/Skip handling;
+they differ only in wording, section keywords, and which state keys they
+read and write. Keeping the layout and the state transitions in one
+function means a fix or optimization lands in both screens at once
+instead of drifting apart across two copies.
+"""
+
+import logging
+import streamlit as st
+from typing import Any, Callable, Dict, Tuple
+from state import AppState
+from graph import run_graph_step
+
+logger = logging.getLogger(__name__)
+
+# Everything that distinguishes the two screens lives in these dicts; the
+# renderer itself is screen-agnostic.
+EXPERIENCE_REVIEW_CONFIG: Dict[str, Any] = {
+    "header": "💼 Review Experience Entry",
+    "entity": "experience",
+    "tags_label": "Skills",
+    "tailored_subheader": "🎯 AI-Tailored Entry",
+    "placeholder": ("Example: This entry should emphasize cloud technologies more. "
+                    "Please add specific AWS services mentioned in the job description."),
+    "index_key": "experience_index",
+    "entries_key": "source_experience_entries",
+    "section_keywords": ("experience", "work"),
+    "continue_step": "continue_experience_tailoring",
+    "complete_step": "experience_tailoring_complete",
+    "complete_message": "Continuing to projects...",
+}
+
+PROJECTS_REVIEW_CONFIG: Dict[str, Any] = {
+    "header": "🚀 Review Project Entry",
+    "entity": "project",
+    "tags_label": "Technologies",
+    "tailored_subheader": "🎯 Tailored Entry",
+    "placeholder": ("Example: This project should emphasize cloud technologies more. "
+                    "Please add specific AWS services mentioned in the job description."),
+    "index_key": "project_index",
+    "entries_key": "source_project_entries",
+    "section_keywords": ("project",),
+    "continue_step": "continue_projects_tailoring",
+    "complete_step": "projects_tailoring_complete",
+    "complete_message": "Continuing to summary...",
+}
+
+
+def _entry_markdown(entry, tags_label: str) -> str:
+    """Format a CV entry as one markdown blob.
+
+    A single st.markdown call produces one frontend delta instead of one per
+    detail line, which matters because this view re-renders on every rerun.
+    """
+    lines = [f"**{entry.title}**"]
+    if entry.subtitle:
+        lines.append(f"*{entry.subtitle}*")
+    if entry.date_range:
+        lines.append(f"📅 {entry.date_range}")
+    lines.extend(f"• {detail}" for detail in entry.details)
+    if entry.tags:
+        lines.append(f"🏷️ **{tags_label}:** {', '.join(entry.tags)}")
+    return "\n\n".join(lines)
+
+
+def render_entry_review(state: AppState, update_app_state: Callable[[AppState], None],
+                        config: Dict[str, Any]) -> None:
+    """Render the one-by-one review interface described by config."""
+    st.header(config["header"])
+
+    entity = config["entity"]
+    keywords: Tuple[str, ...] = config["section_keywords"]
+
+    # Get current progress
+    entry_index = state.get(config["index_key"], 0)
+    source_cv = state.get("source_cv")
+    tailored_cv = state.get("tailored_cv")
+
+    if not source_cv or not hasattr(source_cv, 'sections'):
+        st.error("No source CV data available for review.")
+        return
+
+    # Prefer the view precomputed during section mapping; this renderer runs
+    # on every Streamlit rerun, so rescanning the sections each time is waste.
+    source_entries = state.get(config["entries_key"])
+    if not source_entries:
+        source_entries = []
+        for section in source_cv.sections:
+            if any(keyword in section.name.lower() for keyword in keywords):
+                source_entries.extend(section.entries)
+
+    if not source_entries:
+        st.warning(f"No {entity} entries found in source CV.")
+        return
+
+    total_entries = len(source_entries)
+
+    if entry_index >= total_entries:
+        st.error(f"Invalid {entity} index: {entry_index} >= {total_entries}")
+        return
+
+    # Show progress
+    st.markdown(f"**Progress:** Entry {entry_index + 1} of {total_entries}")
+    progress_bar = st.progress((entry_index + 1) / total_entries)
+
+    # Get current entry being reviewed
+    current_entry = source_entries[entry_index]
+
+    # Display original vs tailored
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📄 Original Entry")
+        with st.container():
+            st.markdown(_entry_markdown(current_entry, config["tags_label"]))
+
+    with col2:
+        st.subheader(config["tailored_subheader"])
+        # Find the tailored entry via the CV's cached name index
+        tailored_entry = None
+        if tailored_cv and hasattr(tailored_cv, 'sections'):
+            for keyword in keywords:
+                tailored_section = tailored_cv.get_section(keyword)
+                if tailored_section and entry_index < len(tailored_section.entries):
+                    tailored_entry = tailored_section.entries[entry_index]
+                    break
+
+        if tailored_entry:
+            with st.container():
+                st.markdown(_entry_markdown(tailored_entry, config["tags_label"]))
+        else:
+            st.warning("Tailored entry not available yet.")
+
+    # Feedback section
+    st.divider()
+    st.subheader("💬 Your Feedback")
+    feedback = st.text_area(
+        "Provide feedback for this specific entry (optional for approval, required for revision):",
+        value="",
+        height=100,
+        help="Provide specific feedback on what should be changed, added, or removed for this entry.",
+        placeholder=config["placeholder"]
+    )
+
+    # All entries processed -> advance to the next phase; otherwise next entry.
+    next_step = (config["complete_step"]
+                 if entry_index + 1 >= total_entries
+                 else config["continue_step"])
+
+    # Action buttons
+    st.subheader("🎯 Choose Your Action")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("✅ Approve Entry", type="primary", use_container_width=True, help="Accept this tailored entry and move to the next one"):
+            logger.info(f"User approved {entity} entry {entry_index + 1}")
+            # One merged dict instead of copy-then-mutate key by key.
+            new_state = {
+                **state,
+                "human_feedback": feedback,
+                "human_approved": True,
+                # Increment the index after user approval
+                config["index_key"]: entry_index + 1,
+                "current_step": next_step,
+            }
+
+            try:
+                # Run the next step immediately
+                final_state = run_graph_step(new_state)
+                update_app_state(final_state)
+
+                if entry_index + 1 >= total_entries:
+                    st.success(f"✅ All {entity} entries approved! {config['complete_message']}")
+                else:
+                    st.success(f"✅ Entry {entry_index + 1} approved! Continuing to entry {entry_index + 2}...")
+                st.rerun()
+            except Exception as e:
+                logger.error(f"Failed to continue workflow after approval: {str(e)}")
+                st.error(f"❌ Failed to continue: {str(e)}")
+
+    with col2:
+        if st.button("🔄 Revise Entry", use_container_width=True, help="Request changes to this specific entry"):
+            if feedback.strip():
+                logger.info(f"User requested revision for {entity} entry {entry_index + 1}")
+                # Store feedback and regenerate this specific entry
+                new_state = {
+                    **state,
+                    "human_feedback": feedback,
+                    "human_approved": False,
+                    "current_step": config["continue_step"],  # Regenerate current entry
+                }
+
+                update_app_state(new_state)
+                st.info(f"🔄 Entry {entry_index + 1} revision requested! Click 'Generate Tailored CV' to regenerate with your feedback.")
+                st.rerun()
+            else:
+                st.warning("⚠️ Please provide specific feedback before requesting revision.")
+
+    with col3:
+        if st.button("⏭️ Skip Entry", use_container_width=True, help="Keep original entry and move to the next one"):
+            logger.info(f"User skipped {entity} entry {entry_index + 1}")
+            new_state = {
+                **state,
+                "human_approved": True,  # Semantically, skipping is a form of approval of the original
+                "user_intent": "skip",
+                # Increment the index after user action
+                config["index_key"]: entry_index + 1,
+                "current_step": next_step,
+            }
+
+            try:
+                # Run the next step immediately
+                final_state = run_graph_step(new_state)
+                update_app_state(final_state)
+
+                if entry_index + 1 >= total_entries:
+                    st.success(f"✅ All {entity} entries processed! {config['complete_message']}")
+                else:
+                    st.success(f"⏭️ Entry {entry_index + 1} skipped! Continuing to entry {entry_index + 2}...")
+                st.rerun()
+            except Exception as e:
+                logger.error(f"Failed to continue workflow after approval: {str(e)}")
+                st.error(f"❌ Failed to continue: {str(e)}")
@@ -0,0 +1,121 @@
+"""Shared review renderer for the section-level tailoring screens.
+
+The qualifications and summary review screens are the same side-by-side
+layout: generated section on the left, the matching source section —
+resolved through the section map — on the right, approval buttons below.
+As with ui_components.entry_review, the layout lives here once and each
+screen contributes a config dict, so the two cannot drift apart.
+"""
+
+import streamlit as st
+from typing import Any, Callable, Dict, Optional
+from state import AppState
+
+
+def _qualifications_markdown(section) -> Optional[str]:
+    """One bulleted markdown list of the generated qualification titles."""
+    return "- " + "\n- ".join(entry.title for entry in section.entries)
+
+
+def _summary_markdown(section) -> Optional[str]:
+    """The generated summary's title plus its detail lines, or None if empty."""
+    if not section.entries:
+        return None
+    summary_entry = section.entries[0]  # Should be only one entry for summary
+    return "\n\n".join([f"**{summary_entry.title}**"] + list(summary_entry.details))
+
+
+QUALIFICATIONS_REVIEW_CONFIG: Dict[str, Any] = {
+    "header": "📋 Review Key Qualifications",
+    "step_text": "**Step 3:** Review the AI-generated key qualifications and choose to approve or request changes.",
+    "generated_subheader": "🎯 Generated Key Qualifications",
+    "generated_markdown": _qualifications_markdown,
+    "missing_generated_warning": "No qualifications section found in CV.",
+    "section_keywords": ("qualifications",),
+    "original_subheader": "📄 Original Skills/Qualifications",
+    "source_index_attr": "qualifications_source_index",
+    "original_entity": "qualifications",
+    "missing_original_warning": "No original skills/qualifications section could be identified in the source CV.",
+    "approval_key": "qualifications",
+    "next_step": "start_experience_tailoring",
+}
+
+SUMMARY_REVIEW_CONFIG: Dict[str, Any] = {
+    "header": "📝 Review Executive Summary",
+    "step_text": "**Step 2:** Review the AI-generated executive summary and choose to approve or request changes.",
+    "generated_subheader": "🎯 Generated Executive Summary",
+    "generated_markdown": _summary_markdown,
+    "missing_generated_warning": "No executive summary found in CV.",
+    "section_keywords": ("summary", "executive"),
+    "original_subheader": "📄 Original Summary/Profile",
+    "source_index_attr": "executive_summary_source_index",
+    "original_entity": "summary",
+    "missing_original_warning": "No original summary/profile section could be identified in the source CV.",
+    "approval_key": "summary",
+    "next_step": "start_cv_finalization",
+}
+
+
+def render_section_review(state: AppState, render_approval_buttons: Callable,
+                          config: Dict[str, Any]) -> None:
+    """Render the side-by-side review interface described by config."""
+    st.header(config["header"])
+    st.markdown(config["step_text"])
+
+    # Bind the state reads once up front; this function re-runs on every
+    # widget interaction
+    cv_data = state.get("tailored_cv")
+    source_data = state.get("source_cv")
+    section_map = state.get("section_map")
+
+    # Create side-by-side layout
+    col1, col2 = st.columns(2)
+
+    # Left column: the generated section
+    with col1:
+        st.subheader(config["generated_subheader"])
+        if cv_data is not None:
+            # Find the section via the CV's cached name index instead of
+            # rescanning the sections on every rerun
+            generated_section = None
+            for keyword in config["section_keywords"]:
+                generated_section = cv_data.get_section(keyword)
+                if generated_section is not None:
+                    break
+
+            # One st.markdown call -> one frontend delta, instead of one per
+            # detail line on every rerun
+            markdown = (config["generated_markdown"](generated_section)
+                        if generated_section is not None else None)
+            if markdown is not None:
+                st.markdown(markdown)
+            else:
+                st.warning(config["missing_generated_warning"])
+        else:
+            st.warning("No CV data available.")
+
+    # Right column: the original section, located via the section map
+    with col2:
+        st.subheader(config["original_subheader"])
+        original_section = None
+
+        source_index = (getattr(section_map, config["source_index_attr"])
+                        if section_map else None)
+        if source_data and source_index is not None:
+            sections = source_data.sections
+            if 0 <= source_index < len(sections):
+                original_section = sections[source_index]
+            else:
+                st.warning(f"Original {config['original_entity']} section index out of bounds.")
+
+        if original_section is not None:
+            # Same batching as above for the source-side details
+            st.markdown("\n\n".join(
+                detail
+                for entry in original_section.entries
+                for detail in entry.details
+            ))
+        else:
+            st.warning(config["missing_original_warning"])
+
+    render_approval_buttons(state, config["approval_key"], config["next_step"])